@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import asyncio
-import json
 from typing import Any
 
 from starlette.applications import Starlette
@@ -13,6 +12,7 @@ from starlette.responses import HTMLResponse, JSONResponse, StreamingResponse
 from starlette.routing import Route
 
 from remora.service.api import RemoraService
+from remora.utils import json_dumps
 
 
 def create_app(service: RemoraService | None = None) -> Starlette:
@@ -40,7 +40,7 @@ def create_app(service: RemoraService | None = None) -> Starlette:
             while True:
                 emitted = False
                 async for event in service.replay_events(graph_id, after_id=last_id):
-                    payload = json.dumps(event, default=str)
+                    payload = json_dumps(event)
                     last_id = int(event.get("id", last_id))
                     emitted = True
                     yield f"event: replay\ndata: {payload}\n\n"
@@ -11,6 +11,7 @@ import click
 from remora.adapters.starlette import create_app
 from remora.core.config import ConfigError, load_config
 from remora.service.api import RemoraService
+from remora.utils import event_loop
 
 
 @click.group()
@@ -90,7 +91,7 @@ def swarm_start(
 
             return event_store, subscriptions, swarm_state
 
-        event_store, subscriptions, swarm_state = asyncio.run(_prepare_lsp())
+        event_store, subscriptions, swarm_state = event_loop.run(_prepare_lsp())
 
         from remora.lsp.__main__ import main as lsp_main
 
@@ -184,7 +185,7 @@ def swarm_start(
                 await nvim_server.stop()
             await swarm_state.close()
 
-    asyncio.run(_start())
+    event_loop.run(_start())
 
 
 @swarm.command("reconcile")
@@ -227,7 +228,7 @@ def swarm_reconcile(project_root: str | None, config_path: str | None) -> None:
         await subscriptions.close()
         await swarm_state.close()
 
-    asyncio.run(_reconcile())
+    event_loop.run(_reconcile())
 
 
 @swarm.command("list")
@@ -260,7 +261,7 @@ def swarm_list(project_root: str | None) -> None:
 
         await swarm_state.close()
 
-    asyncio.run(_list())
+    event_loop.run(_list())
 
 
 @swarm.command("emit")
@@ -310,7 +311,7 @@ def swarm_emit(event_type: str, data: str | None, project_root: str | None) -> N
 
         await event_store.close()
 
-    asyncio.run(_emit())
+    event_loop.run(_emit())
 
 
 @main.command()
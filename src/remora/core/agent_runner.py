@@ -131,6 +131,15 @@ class AgentRunner:
             for k in stale_keys:
                 self._correlation_depth.pop(k, None)
 
+            # Cooldown stamps only matter within the cooldown window.
+            cutoff_ms = now * 1000 - self._trigger_cooldown_ms
+            expired_agents = [
+                agent_id for agent_id, last_time in self._last_trigger_time.items()
+                if last_time < cutoff_ms
+            ]
+            for agent_id in expired_agents:
+                self._last_trigger_time.pop(agent_id, None)
+
     def _check_cooldown(self, agent_id: str) -> bool:
         """Check if the agent is within cooldown period."""
         now = time.time() * 1000
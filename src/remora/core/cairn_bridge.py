@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
 from enum import Enum
 from pathlib import Path
 from typing import Any
@@ -18,7 +19,7 @@ from cairn.runtime import workspace_manager as cairn_workspace_manager
 from remora.core.config import Config, DEFAULT_IGNORE_PATTERNS
 from remora.core.cairn_externals import CairnExternals
 from remora.core.errors import WorkspaceError
-from remora.core.workspace import AgentWorkspace
+from remora.core.workspace import AgentWorkspace, AsyncReadWriteLock
 from remora.utils import PathLike, PathResolver, normalize_path
 
 logger = logging.getLogger(__name__)
@@ -52,7 +53,7 @@ class CairnWorkspaceService:
         self._manager = cairn_workspace_manager.WorkspaceManager()
         self._stable_workspace: Any | None = None
         self._agent_workspaces: dict[str, AgentWorkspace] = {}
-        self._stable_lock = asyncio.Lock()
+        self._stable_lock = AsyncReadWriteLock()
         self._ignore_patterns: set[str] = set(config.workspace_ignore_patterns or DEFAULT_IGNORE_PATTERNS)
         self._ignore_dotfiles: bool = config.workspace_ignore_dotfiles
 
@@ -110,7 +111,7 @@ class CairnWorkspaceService:
             agent_id,
             stable_workspace=self._stable_workspace,
             ensure_file_synced=self.ensure_file_synced,
-            lock=asyncio.Lock(),
+            lock=AsyncReadWriteLock(),
             stable_lock=self._stable_lock,
         )
         self._agent_workspaces[agent_id] = agent_workspace
@@ -140,16 +141,7 @@ class CairnWorkspaceService:
         if self._stable_workspace is None:
             return
 
-        for path in self._project_root.rglob("*"):
-            if path.is_dir():
-                continue
-            if self._should_ignore(path):
-                continue
-
-            if not self._resolver.is_within_project(path):
-                continue
-            rel_path = self._resolver.to_workspace_path(path)
-
+        for rel_path, path in await asyncio.to_thread(self._collect_project_files):
             try:
                 payload = path.read_bytes()
             except OSError as exc:
@@ -165,18 +157,44 @@ class CairnWorkspaceService:
         """Ensure a specific file is synced to workspace."""
         return True
 
-    def _should_ignore(self, path: Path) -> bool:
-        try:
-            rel_parts = path.relative_to(self._project_root).parts
-        except ValueError:
-            return True
-
-        for part in rel_parts:
-            if part in self._ignore_patterns:
-                return True
-            if self._ignore_dotfiles and part.startswith("."):
-                return True
-        return False
+    def _collect_project_files(self) -> list[tuple[str, Path]]:
+        """Walk the project with ``os.scandir`` and return ``(workspace_path, path)`` pairs.
 
+        Ignored directories are pruned instead of walked, and workspace paths are built from
+        the walk itself, so a plain file costs no syscalls beyond its directory listing.
+        """
+        files: list[tuple[str, Path]] = []
+        pending: list[tuple[str, str]] = [(str(self._project_root), "")]
+        while pending:
+            directory, rel_dir = pending.pop()
+            try:
+                with os.scandir(directory) as it:
+                    entries = sorted(it, key=lambda entry: entry.name)
+            except OSError as exc:
+                logger.debug("Failed to list %s: %s", directory, exc)
+                continue
+            for entry in entries:
+                if self._is_ignored_name(entry.name):
+                    continue
+                rel_path = f"{rel_dir}{entry.name}"
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append((entry.path, f"{rel_path}/"))
+                        continue
+                    if entry.is_symlink():
+                        if not entry.is_file() or not self._resolver.is_within_project(entry.path):
+                            continue
+                        rel_path = self._resolver.to_workspace_path(entry.path)
+                    elif not entry.is_file(follow_symlinks=False):
+                        continue
+                except OSError:
+                    continue
+                files.append((rel_path, Path(entry.path)))
+        return files
+
+    def _is_ignored_name(self, name: str) -> bool:
+        if name in self._ignore_patterns:
+            return True
+        return self._ignore_dotfiles and name.startswith(".")
 
 __all__ = ["CairnWorkspaceService", "SyncMode"]
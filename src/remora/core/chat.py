@@ -1,5 +1,6 @@
 """Chat session wrapper for single-agent interactions."""
 
+import asyncio
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -225,7 +226,7 @@ def build_chat_tools(agent_workspace: AgentWorkspace, project_root: Path) -> lis
     async def file_exists(path: str) -> bool:
         return await agent_workspace.exists(path)
 
-    async def search_files(pattern: str) -> list[str]:
+    def _search(pattern: str) -> list[str]:
         matches: list[str] = []
         for candidate in project_root.rglob(pattern or "*"):
             if candidate.is_file():
@@ -235,9 +236,12 @@ def build_chat_tools(agent_workspace: AgentWorkspace, project_root: Path) -> lis
                     matches.append(str(candidate))
         return sorted(matches)
 
+    async def search_files(pattern: str) -> list[str]:
+        return await asyncio.to_thread(_search, pattern)
+
     async def discover_symbols(path: str = ".") -> list[dict]:
         target = project_root / path
-        nodes = discover([target])
+        nodes = await asyncio.to_thread(discover, [target])
         return [
             {
                 "name": getattr(node, "name", ""),
@@ -7,13 +7,21 @@ and returns CSTNode objects representing functions, classes, files, etc.
 from __future__ import annotations
 
 import hashlib
+import importlib.metadata
 import importlib.resources
 import logging
-from concurrent.futures import ThreadPoolExecutor
+import mmap
+import multiprocessing
+import os
+import pickle
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
+from functools import cache, partial
+from operator import attrgetter
 from pathlib import Path
-from typing import Iterator
 
 import tree_sitter
 from tree_sitter import Language, Parser, QueryCursor, Query
@@ -66,9 +74,9 @@ class CSTNode:
 
 
 def compute_node_id(file_path: str, name: str, start_line: int, end_line: int) -> str:
-    """Compute deterministic node ID using SHA256."""
+    """Compute deterministic 16-hex-char node ID using a 64-bit BLAKE2b digest."""
     content = f"{file_path}:{name}:{start_line}:{end_line}"
-    return hashlib.sha256(content.encode()).hexdigest()[:16]
+    return hashlib.blake2b(content.encode(), digest_size=8).hexdigest()
 
 
 # ============================================================================
@@ -84,6 +92,7 @@ def _get_query_dir() -> Path:
     return Path(importlib.resources.files("remora")) / "queries"
 
 
+@cache
 def _load_queries(language: str, query_pack: str = "remora_core") -> str | None:
     """Load tree-sitter query from .scm file."""
     query_dir = _get_query_dir()
@@ -105,70 +114,255 @@ def _load_queries(language: str, query_pack: str = "remora_core") -> str | None:
 # ============================================================================
 
 
-def _get_parser(language: str) -> Parser | None:
-    """Get a tree-sitter parser for the given language."""
+@cache
+def _get_language(language: str) -> Language | None:
+    """Load the tree-sitter grammar for ``language`` once per process."""
     try:
         # Language libraries are named like tree_sitter_python
         lang_module = __import__(f"tree_sitter_{language}")
-        lang = Language(lang_module.language())
-        parser = Parser(lang)
-        return parser
+        return Language(lang_module.language())
     except (ImportError, AttributeError) as e:
         logger.debug("Could not load parser for %s: %s", language, e)
         return None
 
 
+_thread_local = threading.local()
+
+
+def _get_parser(language: str) -> Parser | None:
+    """Get a tree-sitter parser for the given language.
+
+    Parsers must not be shared between threads, so each thread keeps one per language.
+    """
+    parsers: dict[str, Parser] | None = getattr(_thread_local, "parsers", None)
+    if parsers is None:
+        parsers = _thread_local.parsers = {}
+    parser = parsers.get(language)
+    if parser is None:
+        lang = _get_language(language)
+        if lang is None:
+            return None
+        parser = parsers[language] = Parser(lang)
+    return parser
+
+
 NAME_CAPTURE_SUFFIXES = (".name", ".lang")
 
 
-def _parse_file(file_path: Path, language: str) -> list[CSTNode]:
-    """Parse a single file and extract nodes using tree-sitter queries."""
+@dataclass(frozen=True, slots=True)
+class _CompiledQuery:
+    """A compiled query pack with its capture names resolved up front."""
+
+    language: str
+    query: Query
+    # capture name -> node type it defines, or None for name-only captures
+    node_types: dict[str, str | None]
+
+
+@cache
+def _get_query(language: str) -> _CompiledQuery | None:
+    """Compile the query pack for ``language`` once per process."""
+    query_text = _load_queries(language)
+    lang = _get_language(language)
+    if query_text is None or lang is None:
+        return None
+    try:
+        query = Query(lang, query_text)
+    except Exception as e:
+        logger.warning("Query error for %s: %s", language, e)
+        return None
+    node_types: dict[str, str | None] = {}
+    for index in range(query.capture_count):
+        name = query.capture_name(index)
+        node_types[name] = None if name.endswith(NAME_CAPTURE_SUFFIXES) else name.split(".", 1)[0]
+    return _CompiledQuery(language, query, node_types)
+
+
+MMAP_THRESHOLD = 64 * 1024
+
+
+def _read_source(file_path: str) -> bytes | mmap.mmap:
+    """Read a source file, mapping large files instead of copying them into ``bytes``."""
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+            return f.read()
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _parse_file(file_path: str, language: str, cache_dir: Path | None = None) -> list[CSTNode]:
+    """Parse a single file and extract nodes using tree-sitter queries.
+
+    With ``cache_dir``, results are memoized on disk per file path and reused while
+    the content, query pack and tree-sitter versions are unchanged.
+    """
     parser = _get_parser(language)
     if parser is None:
         # Fall back to file-level node
         return [_create_file_node(file_path)]
 
     try:
-        content = file_path.read_text(encoding="utf-8")
-    except (OSError, UnicodeDecodeError) as e:
+        source = _read_source(file_path)
+    except OSError as e:
         logger.warning("Could not read %s: %s", file_path, e)
         return []
 
-    tree = parser.parse(content.encode())
+    try:
+        if cache_dir is None:
+            return _parse_source(file_path, language, parser, source)
 
-    # Load and apply queries
-    query_text = _load_queries(language)
-    if query_text is None:
+        cache_path = _cache_path(cache_dir, file_path, language)
+        content_key = _content_key(language, source)
+        cached = _load_cached(cache_path, content_key)
+        if cached is not None:
+            return cached
+
+        nodes = _parse_source(file_path, language, parser, source)
+        _store_cached(cache_path, content_key, nodes)
+        return nodes
+    finally:
+        if isinstance(source, mmap.mmap):
+            source.close()
+
+
+def _parse_source(file_path: str, language: str, parser: Parser, source: bytes | mmap.mmap) -> list[CSTNode]:
+    try:
+        content = str(source, "utf-8")
+    except UnicodeDecodeError as e:
+        logger.warning("Could not read %s: %s", file_path, e)
+        return []
+
+    compiled = _get_query(language)
+    if compiled is None:
+        return [_create_file_node(file_path, content)]
+
+    # The tree reads node text from ``source``, so it must stay open until extraction is done.
+    tree = parser.parse(source)
+    if tree.root_node.has_error and _mostly_errors(tree.root_node):
+        logger.warning("Skipping queries for %s: mostly unparseable", file_path)
         return [_create_file_node(file_path, content)]
+    return _extract_nodes(file_path, tree.root_node, _span_reader(source, content), content, compiled)
+
+
+# Bump when extraction or the entry format changes, so results cached by older code are not reused.
+CACHE_VERSION = 2
+
 
+def _package_version(distribution: str) -> str:
     try:
-        lang_module = __import__(f"tree_sitter_{language}")
-        lang = Language(lang_module.language())
-        query = Query(lang, query_text)
+        return importlib.metadata.version(distribution)
+    except importlib.metadata.PackageNotFoundError:
+        return ""
+
+
+@cache
+def _cache_salt(language: str) -> bytes:
+    # Grammar and runtime upgrades change spans and node types, so they invalidate entries too.
+    query_text = _load_queries(language) or ""
+    runtime = _package_version("tree-sitter")
+    grammar = _package_version(f"tree-sitter-{language}")
+    return f"{CACHE_VERSION}\0{language}\0{runtime}\0{grammar}\0{query_text}\0".encode()
+
+
+def _cache_path(cache_dir: Path, file_path: str, language: str) -> Path:
+    """Locate the single cache entry for ``file_path``; edits overwrite it rather than adding more."""
+    key = hashlib.blake2b(f"{language}\0{file_path}".encode(), digest_size=16).hexdigest()
+    return cache_dir / key[:2] / key[2:]
+
+
+def _content_key(language: str, source: bytes | mmap.mmap) -> bytes:
+    digest = hashlib.blake2b(_cache_salt(language), digest_size=16)
+    digest.update(source)
+    return digest.digest()
+
+
+def _load_cached(cache_path: Path, content_key: bytes) -> list[CSTNode] | None:
+    try:
+        data = cache_path.read_bytes()
+    except OSError:
+        return None
+    try:
+        stored_key, nodes = pickle.loads(data)
     except Exception as e:
-        logger.warning("Query error for %s: %s", language, e)
-        return [_create_file_node(file_path, content)]
+        logger.debug("Ignoring unreadable discovery cache entry %s: %s", cache_path, e)
+        return None
+    return nodes if stored_key == content_key else None
+
+
+def _store_cached(cache_path: Path, content_key: bytes, nodes: list[CSTNode]) -> None:
+    # Write then rename, so concurrent workers never see a partial entry.
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(pickle.dumps((content_key, nodes), protocol=pickle.HIGHEST_PROTOCOL))
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.debug("Could not write discovery cache entry %s: %s", cache_path, e)
+
+
+MAX_ERROR_RATIO = 0.5
+
+
+def _mostly_errors(root: tree_sitter.Node) -> bool:
+    """Whether more than ``MAX_ERROR_RATIO`` of the source lies in top-level nodes with parse errors.
+
+    Spans are weighed by bytes, since tree-sitter folds a run of garbage into a single ERROR node.
+    """
+    error_bytes = sum(child.end_byte - child.start_byte for child in root.children if child.has_error)
+    return error_bytes > (root.end_byte - root.start_byte) * MAX_ERROR_RATIO
+
+
+SpanReader = Callable[[int, int], str]
 
-    # Extract matches
-    nodes = []
-    captures = _collect_captures(query, tree.root_node)
 
-    for node, capture_name in captures:
-        if capture_name.endswith(NAME_CAPTURE_SUFFIXES):
-            continue  # Skip name-only captures
+def _span_reader(source: bytes | mmap.mmap, content: str) -> SpanReader:
+    """Return a reader for the text between two tree-sitter byte offsets.
 
-        node_type = capture_name.split(".", 1)[0]
-        name = _extract_name(node, captures)
+    For ASCII sources byte and character offsets coincide, so spans are sliced
+    from the already-decoded ``content`` instead of decoded one by one.
+    """
+    if content.isascii():
+        return lambda start, end: content[start:end]
+    return lambda start, end: str(source[start:end], "utf-8", "replace")
+
+
+def _extract_nodes(
+    file_path: str,
+    root: tree_sitter.Node,
+    read_span: SpanReader,
+    content: str,
+    compiled: _CompiledQuery,
+) -> list[CSTNode]:
+    """Run the compiled query pack over a parsed file and build its nodes."""
+    # Split captures into definitions and an index of name captures by the
+    # node they name, so each definition finds its name without a rescan.
+    node_types = compiled.node_types
+    definitions: list[tuple[tree_sitter.Node, str]] = []
+    name_nodes: dict[int, tree_sitter.Node] = {}
+    for node, capture_name in _collect_captures(compiled, root):
+        node_type = node_types[capture_name]
+        if node_type is not None:
+            definitions.append((node, node_type))
+            continue
+        parent = node.parent
+        if parent is not None:
+            name_nodes.setdefault(parent.id, node)
+
+    nodes = []
+
+    for node, node_type in definitions:
+        name = _extract_name(node, name_nodes.get(node.id), read_span)
+        start_line = node.start_point[0] + 1
+        end_line = node.end_point[0] + 1
 
         cst_node = CSTNode(
-            node_id=compute_node_id(str(file_path), name, node.start_point[0] + 1, node.end_point[0] + 1),
+            node_id=compute_node_id(file_path, name, start_line, end_line),
             node_type=node_type,
             name=name,
             full_name=f"{node_type}:{name}",
-            file_path=str(file_path),
-            text=content[node.start_byte : node.end_byte],
-            start_line=node.start_point[0] + 1,
-            end_line=node.end_point[0] + 1,
+            file_path=file_path,
+            text=read_span(node.start_byte, node.end_byte),
+            start_line=start_line,
+            end_line=end_line,
             start_byte=node.start_byte,
             end_byte=node.end_byte,
         )
@@ -181,56 +375,132 @@ def _parse_file(file_path: Path, language: str) -> list[CSTNode]:
     return nodes
 
 
-def _collect_captures(query: tree_sitter.Query, root: tree_sitter.Node) -> list[tuple[tree_sitter.Node, str]]:
-    """Collect captures with compatibility across tree-sitter versions."""
+# (file_path, text, rows): a file's nodes with their text stored once. Each row
+# is a CSTNode's fields in order, with ``text`` replaced by ``(start, end)``
+# offsets into the shared text.
+PackedNodes = tuple[str, str, list[tuple]]
+
+
+def _parse_entry_packed(entry: tuple[str, str], cache_dir: Path | None = None) -> PackedNodes | list[CSTNode]:
+    """Process-pool task: like ``_parse_entry``, packed for a cheaper trip back.
+
+    Node texts are nested slices of the file (the file node holds all of it), so
+    pickling each one would send most of the file several times over.
+    """
+    nodes = _parse_entry(entry, cache_dir)
+    if not nodes:
+        return nodes
+    text = max((node.text for node in nodes), key=len)
+    rows = []
+    for node in nodes:
+        node_text = node.text
+        # Character offsets trail byte offsets, so the text starts at or before start_byte.
+        if text.startswith(node_text, node.start_byte):
+            start = node.start_byte
+        else:
+            start = text.rfind(node_text, 0, node.start_byte + len(node_text))
+            if start < 0:
+                return nodes
+        rows.append(
+            (
+                node.node_id,
+                node.node_type,
+                node.name,
+                node.full_name,
+                (start, start + len(node_text)),
+                node.start_line,
+                node.end_line,
+                node.start_byte,
+                node.end_byte,
+            )
+        )
+    return nodes[0].file_path, text, rows
+
+
+def _unpack_nodes(packed: PackedNodes | list[CSTNode]) -> list[CSTNode]:
+    if isinstance(packed, list):
+        return packed
+    file_path, text, rows = packed
+    return [
+        CSTNode(node_id, node_type, name, full_name, file_path, text[start:end], *position)
+        for node_id, node_type, name, full_name, (start, end), *position in rows
+    ]
+
+
+def _preload_languages(languages: Iterable[str]) -> None:
+    """Load grammars and compile query packs before the first file needs them."""
+    for language in languages:
+        _get_query(language)
+
+
+def _parse_entry(entry: tuple[str, str], cache_dir: Path | None = None) -> list[CSTNode]:
+    """Executor task: parse one ``(path, language)`` entry, logging instead of raising."""
+    file_path, language = entry
     try:
-        captures = query.captures(root)
-    except AttributeError:
-        cursor = QueryCursor(query)
-        captures = cursor.captures(root)
+        return _parse_file(file_path, language, cache_dir)
+    except Exception as e:
+        logger.warning("Parse error in %s: %s", file_path, e)
+        return []
 
-    if isinstance(captures, dict):
-        flat: list[tuple[tree_sitter.Node, str]] = []
-        for name, nodes in captures.items():
-            for node in nodes:
-                flat.append((node, name))
-        return flat
 
-    return list(captures)
+def _get_cursor(compiled: _CompiledQuery) -> QueryCursor:
+    """Get this thread's reusable cursor for a compiled query pack."""
+    cursors: dict[str, QueryCursor] | None = getattr(_thread_local, "cursors", None)
+    if cursors is None:
+        cursors = _thread_local.cursors = {}
+    cursor = cursors.get(compiled.language)
+    if cursor is None:
+        cursor = cursors[compiled.language] = QueryCursor(compiled.query)
+    return cursor
 
 
-def _extract_name(node: tree_sitter.Node, captures: list) -> str:
+def _collect_captures(compiled: _CompiledQuery, root: tree_sitter.Node) -> list[tuple[tree_sitter.Node, str]]:
+    """Collect captures as ``(node, capture_name)`` pairs.
+
+    Captures are returned in the order their names appear in the query pack, so
+    a node matched by several patterns is seen first under the earliest one.
+    """
+    captures = _get_cursor(compiled).captures(root)
+    flat: list[tuple[tree_sitter.Node, str]] = []
+    for name in compiled.node_types:
+        for node in captures.get(name, ()):
+            flat.append((node, name))
+    return flat
+
+
+def _extract_name(node: tree_sitter.Node, name_node: tree_sitter.Node | None, read_span: SpanReader) -> str:
     """Extract the name for a captured node."""
-    # Look for corresponding .name capture
-    for n, name in captures:
-        if name.endswith(NAME_CAPTURE_SUFFIXES) and n.parent == node:
-            return n.text.decode() if n.text else "unknown"
+    # Prefer the node's own .name capture
+    if name_node is not None:
+        return read_span(name_node.start_byte, name_node.end_byte) or "unknown"
 
     # Try common child names
     for child in node.children:
         if child.type in ("identifier", "name", "function_name"):
-            return child.text.decode() if child.text else "unknown"
+            return read_span(child.start_byte, child.end_byte) or "unknown"
 
     return "unknown"
 
 
-def _create_file_node(file_path: Path, content: str | None = None) -> CSTNode:
+def _create_file_node(file_path: str, content: str | None = None) -> CSTNode:
     """Create a file-level CSTNode."""
     if content is None:
         try:
-            content = file_path.read_text(encoding="utf-8")
+            with open(file_path, encoding="utf-8") as f:
+                content = f.read()
         except (OSError, UnicodeDecodeError):
             content = ""
 
     line_count = content.count("\n") + 1 if content else 1
 
     byte_length = len(content.encode("utf-8")) if content else 0
+    name = os.path.basename(file_path)
     return CSTNode(
-        node_id=compute_node_id(str(file_path), file_path.name, 1, line_count),
+        node_id=compute_node_id(file_path, name, 1, line_count),
         node_type="file",
-        name=file_path.name,
-        full_name=file_path.name,
-        file_path=str(file_path),
+        name=name,
+        full_name=name,
+        file_path=file_path,
         text=content,
         start_line=1,
         end_line=line_count,
@@ -249,70 +519,141 @@ def discover(
     languages: list[str] | None = None,
     node_types: list[str] | None = None,
     max_workers: int = 4,
+    use_processes: bool = False,
+    cache_dir: PathLike | None = None,
 ) -> list[CSTNode]:
     """Scan source paths with tree-sitter and return discovered nodes.
 
-    Uses thread pool for parallel file parsing. Language is auto-detected
+    Uses a thread pool for parallel file parsing. Language is auto-detected
     from file extension. Custom .scm queries are loaded from queries/ dir.
 
     Args:
         paths: Files or directories to scan
         languages: Limit to specific languages (by extension, e.g. "python")
         node_types: Filter to specific node types ("function", "class", etc.)
-        max_workers: Thread pool size for parallel parsing
+        max_workers: Pool size for parallel parsing
+        use_processes: Parse in worker processes instead of threads. Query
+            extraction is Python code bound by the GIL, so this scales with
+            cores on large trees at the cost of process start-up.
+        cache_dir: Directory for memoizing per-file results across calls;
+            unchanged files are then loaded instead of parsed. It holds one
+            entry per source file, overwritten when the file changes; entries
+            for deleted files stay until the directory is removed, which is
+            always safe. Entries are read with ``pickle.loads``, so only use
+            a directory that untrusted users cannot write to.
 
     Returns:
         List of CSTNode objects sorted by file path and line number
     """
     path_list = [normalize_path(p) for p in paths]
+    wanted = frozenset(languages) if languages is not None else None
 
-    files: list[tuple[Path, str]] = []
+    files: list[tuple[str, str]] = []
     for path in path_list:
         if path.is_file():
             lang = _detect_language(path)
-            if lang and (languages is None or lang in languages):
-                files.append((path, lang))
+            if lang and (wanted is None or lang in wanted):
+                files.append((str(path), lang))
         elif path.is_dir():
-            for file_path in _walk_directory(path):
-                lang = _detect_language(file_path)
-                if lang and (languages is None or lang in languages):
-                    files.append((file_path, lang))
+            files.extend(_walk_directory(path, wanted))
 
-    all_nodes: list[CSTNode] = []
+    # Largest files first, so the pool does not finish waiting on one big straggler.
+    files.sort(key=_entry_size, reverse=True)
 
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = [executor.submit(_parse_file, file_path, lang) for file_path, lang in files]
-        for future in futures:
-            try:
-                nodes = future.result()
-                all_nodes.extend(nodes)
-            except Exception as e:
-                logger.warning("Parse error: %s", e)
+    all_nodes: list[CSTNode] = []
+    file_languages = tuple({lang for _, lang in files})
+
+    executor: Executor
+    if use_processes and len(files) > 1:
+        # spawn: discover() usually runs in a thread of an asyncio program, which is unsafe to fork.
+        executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_preload_languages,
+            initargs=(file_languages,),
+        )
+        chunksize = max(1, len(files) // (max_workers * 4))
+        task = _parse_entry_packed
+    else:
+        # Threads share the caches; fill them once here rather than racing on the first files.
+        _preload_languages(file_languages)
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        chunksize = 1
+        task = _parse_entry
+
+    cache_path = normalize_path(cache_dir) if cache_dir is not None else None
+    with executor:
+        for result in executor.map(partial(task, cache_dir=cache_path), files, chunksize=chunksize):
+            all_nodes.extend(_unpack_nodes(result))
+
+    all_nodes.sort(key=_NODE_ORDER)
+
+    # Patterns overlap (a method also matches the plain function pattern); the
+    # sort is stable, so the first, most specific match of each node wins.
+    unique: dict[str, CSTNode] = {}
+    for node in all_nodes:
+        unique.setdefault(node.node_id, node)
+    all_nodes = list(unique.values())
 
     if node_types:
         all_nodes = [n for n in all_nodes if n.node_type in node_types]
 
-    all_nodes.sort(key=lambda n: (n.file_path, n.start_line))
-
     return all_nodes
 
 
-def _detect_language(file_path: Path) -> str | None:
+_NODE_ORDER = attrgetter("file_path", "start_line")
+
+
+def _entry_size(entry: tuple[str, str]) -> int:
+    try:
+        return os.stat(entry[0]).st_size
+    except OSError:
+        return 0
+
+
+def _detect_language(file_path: PathLike) -> str | None:
     """Detect language from file extension."""
-    return LANGUAGE_EXTENSIONS.get(file_path.suffix.lower())
+    return _language_for_suffix(os.path.splitext(file_path)[1])
 
 
-def _walk_directory(directory: Path) -> Iterator[Path]:
-    """Recursively walk directory, skipping hidden and common ignore patterns."""
-    ignore_patterns = {".git", ".venv", "venv", "node_modules", "__pycache__", ".tox"}
+@cache
+def _language_for_suffix(suffix: str) -> str | None:
+    return LANGUAGE_EXTENSIONS.get(suffix.lower())
 
-    for item in directory.iterdir():
-        if item.name.startswith(".") or item.name in ignore_patterns:
+
+_IGNORED_NAMES = frozenset({".git", ".venv", "venv", "node_modules", "__pycache__", ".tox"})
+
+
+def _walk_directory(directory: Path, languages: frozenset[str] | None = None) -> Iterator[tuple[str, str]]:
+    """Recursively walk directory, skipping hidden and common ignore patterns.
+
+    Uses ``os.scandir`` in a single pass and yields ``(path, language)`` for files
+    in ``languages`` (any known language if None). The language is detected from
+    the directory entry, so other files never cost a ``stat``. Paths stay plain
+    strings, as stored on ``CSTNode``.
+    """
+    pending = [str(directory)]
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as it:
+                entries = list(it)
+        except OSError as e:
+            logger.debug("Could not list %s: %s", current, e)
             continue
-        if item.is_file():
-            yield item
-        elif item.is_dir():
-            yield from _walk_directory(item)
+        for entry in entries:
+            name = entry.name
+            if name.startswith(".") or name in _IGNORED_NAMES:
+                continue
+            try:
+                if entry.is_dir():
+                    pending.append(entry.path)
+                    continue
+                lang = _detect_language(name)
+                if lang is not None and (languages is None or lang in languages) and entry.is_file():
+                    yield entry.path, lang
+            except OSError:
+                continue
 
 
 def parse_file(file_path: PathLike) -> list[CSTNode]:
@@ -323,7 +664,7 @@ def parse_file(file_path: PathLike) -> list[CSTNode]:
     language = _detect_language(path_obj)
     if not language:
         return []
-    return _parse_file(path_obj, language)
+    return _parse_file(str(path_obj), language)
 
 
 class NodeType(str, Enum):
@@ -345,12 +686,16 @@ class TreeSitterDiscoverer:
         query_pack: str = "remora_core",
         node_types: list[NodeType | str] | None = None,
         max_workers: int = 4,
+        use_processes: bool = False,
+        cache_dir: PathLike | None = None,
     ) -> None:
         self._paths = [normalize_path(p) for p in root_dirs]
         self._language = language
         self._query_pack = query_pack
         self._node_types = [nt.value if isinstance(nt, NodeType) else nt for nt in node_types] if node_types else None
         self._max_workers = max_workers
+        self._use_processes = use_processes
+        self._cache_dir = cache_dir
 
     def discover(self) -> list[CSTNode]:
         languages: list[str] | None = [self._language] if self._language else None
@@ -359,6 +704,8 @@ class TreeSitterDiscoverer:
             languages=languages,
             node_types=self._node_types,
             max_workers=self._max_workers,
+            use_processes=self._use_processes,
+            cache_dir=self._cache_dir,
         )
 
 
@@ -11,6 +11,7 @@ import asyncio
 import logging
 from collections.abc import Callable, AsyncIterator
 from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from typing import Any
 
 from structured_agents.events import Event as StructuredEvent
@@ -21,6 +22,28 @@ logger = logging.getLogger(__name__)
 
 EventHandler = Callable[[Any], Any]
 
+STREAM_QUEUE_SIZE = 1024
+
+# Per-emit scratch space shared by the handlers of one event; see emit_cached().
+_emit_scope: ContextVar[dict[Any, tuple[Any, Any]] | None] = ContextVar("remora_emit_scope", default=None)
+
+
+def emit_cached[T](event: Any, key: Any, build: Callable[[Any], T]) -> T:
+    """Return ``build(event)``, computed once per ``EventBus.emit`` and shared by its handlers.
+
+    Lets subscribers that derive the same value from an event (such as its serialized form)
+    share it without a process-wide cache; the result is dropped when the emit finishes.
+    Outside of an emit this simply calls ``build``. Treat shared results as read-only.
+    """
+    scope = _emit_scope.get()
+    if scope is None:
+        return build(event)
+    cache_key = (key, id(event))
+    cached = scope.get(cache_key)
+    if cached is None or cached[0] is not event:
+        cached = scope[cache_key] = (event, build(event))
+    return cached[1]
+
 
 class EventBus:
     """Unified event dispatch with Observer protocol support.
@@ -30,59 +53,106 @@ class EventBus:
     """
 
     def __init__(self) -> None:
-        self._handlers: dict[type[Any], list[EventHandler]] = {}
-        self._all_handlers: list[EventHandler] = []
+        # Handlers are kept as insertion-ordered dict keys: dispatch order is preserved and
+        # unsubscribe is a hash lookup. Bound methods hash by (instance, function), so a
+        # freshly accessed ``obj.method`` still finds its registration.
+        self._handlers: dict[type[Any], dict[EventHandler, None]] = {}
+        self._all_handlers: dict[EventHandler, None] = {}
+        # concrete event type -> every handler it dispatches to; reset whenever subscriptions change
+        self._dispatch_cache: dict[type[Any], tuple[EventHandler, ...]] = {}
+        # event type -> attribute -> value -> futures awaiting a matching event, see wait_for_key()
+        self._keyed_waiters: dict[type[Any], dict[str, dict[Any, list[asyncio.Future[Any]]]]] = {}
 
     async def emit(self, event: StructuredEvent | RemoraEvent) -> None:
         event_type = type(event)
-        event_name = event_type.__name__
-        agent_id = getattr(event, "agent_id", None) or getattr(event, "to_agent", None)
-        logger.info(f"EventBus.emit: {event_name} agent_id={agent_id}")
+        handlers = self._dispatch_cache.get(event_type)
+        if handlers is None:
+            handlers = self._dispatch_cache[event_type] = self._resolve_handlers(event_type)
+        if not handlers:
+            return
+        if logger.isEnabledFor(logging.INFO):
+            agent_id = getattr(event, "agent_id", None) or getattr(event, "to_agent", None)
+            logger.info(
+                "EventBus.emit: %s agent_id=%s, %d handlers",
+                event_type.__name__,
+                agent_id,
+                len(handlers),
+            )
 
-        handlers: list[EventHandler] = []
+        token = _emit_scope.set({})
+        try:
+            for handler in handlers:
+                try:
+                    result = handler(event)
+                    if asyncio.iscoroutine(result):
+                        await result
+                except Exception as exc:
+                    logger.warning("Event handler error: %s", exc)
+        finally:
+            _emit_scope.reset(token)
 
+    def _resolve_handlers(self, event_type: type[Any]) -> tuple[EventHandler, ...]:
+        handlers: list[EventHandler] = []
         for registered_type, registered_handlers in self._handlers.items():
-            if isinstance(event, registered_type):
+            if issubclass(event_type, registered_type):
                 handlers.extend(registered_handlers)
-
         handlers.extend(self._all_handlers)
-        logger.info(f"EventBus.emit: {len(handlers)} handlers for {event_name}")
+        # A handler subscribed under overlapping types still runs once per event.
+        return tuple(dict.fromkeys(handlers))
 
-        for handler in handlers:
-            try:
-                result = handler(event)
-                if asyncio.iscoroutine(result):
-                    await result
-            except Exception as exc:
-                logger.warning("Event handler error: %s", exc)
+    def _invalidate(self, event_type: type[Any]) -> None:
+        """Forget cached dispatch for ``event_type`` and its subclasses only."""
+        stale = [cached for cached in self._dispatch_cache if issubclass(cached, event_type)]
+        for cached in stale:
+            del self._dispatch_cache[cached]
 
     def subscribe(self, event_type: type[Any], handler: EventHandler) -> None:
-        if event_type not in self._handlers:
-            self._handlers[event_type] = []
-        if handler not in self._handlers[event_type]:
-            self._handlers[event_type].append(handler)
+        handlers = self._handlers.setdefault(event_type, {})
+        if handler not in handlers:
+            handlers[handler] = None
+            self._invalidate(event_type)
 
     def subscribe_all(self, handler: EventHandler) -> None:
         if handler not in self._all_handlers:
-            self._all_handlers.append(handler)
+            self._all_handlers[handler] = None
+            self._dispatch_cache.clear()
 
     def unsubscribe(self, handler: EventHandler) -> None:
-        for handlers in self._handlers.values():
-            if handler in handlers:
-                handlers.remove(handler)
         if handler in self._all_handlers:
-            self._all_handlers.remove(handler)
+            del self._all_handlers[handler]
+            self._dispatch_cache.clear()
+        for event_type, handlers in self._handlers.items():
+            if handler in handlers:
+                del handlers[handler]
+                self._invalidate(event_type)
 
     @asynccontextmanager
-    async def stream(self, *event_types: type[Any]) -> AsyncIterator[AsyncIterator[StructuredEvent | RemoraEvent]]:
-        queue: asyncio.Queue[StructuredEvent | RemoraEvent] = asyncio.Queue()
-        filter_types = set(event_types) if event_types else None
+    async def stream(
+        self,
+        *event_types: type[Any],
+        maxsize: int = STREAM_QUEUE_SIZE,
+    ) -> AsyncIterator[AsyncIterator[StructuredEvent | RemoraEvent]]:
+        """Yield an iterator over emitted events, optionally limited to ``event_types``.
+
+        At most ``maxsize`` events are buffered; when a slow consumer falls behind, the
+        oldest buffered event is dropped to make room.
+        """
+        queue: asyncio.Queue[StructuredEvent | RemoraEvent] = asyncio.Queue(maxsize=maxsize)
+        dropped = 0
 
         def enqueue(event: StructuredEvent | RemoraEvent) -> None:
-            if filter_types is None or any(isinstance(event, et) for et in filter_types):
-                queue.put_nowait(event)
+            nonlocal dropped
+            if queue.full():
+                queue.get_nowait()
+                dropped += 1
+            queue.put_nowait(event)
 
-        self.subscribe_all(enqueue)
+        # Filter through the per-type dispatch so unwanted events never reach the stream.
+        if event_types:
+            for event_type in event_types:
+                self.subscribe(event_type, enqueue)
+        else:
+            self.subscribe_all(enqueue)
 
         async def iterate() -> AsyncIterator[StructuredEvent | RemoraEvent]:
             while True:
@@ -93,6 +163,8 @@ class EventBus:
             yield iterate()
         finally:
             self.unsubscribe(enqueue)
+            if dropped:
+                logger.warning("EventBus.stream dropped %d events from a slow consumer", dropped)
 
     async def wait_for(
         self,
@@ -104,19 +176,13 @@ class EventBus:
         future: asyncio.Future[StructuredEvent | RemoraEvent] = loop.create_future()
 
         def handler(event: StructuredEvent | RemoraEvent) -> None:
+            if future.done():
+                return
             try:
-                if isinstance(event, event_type) and predicate(event):
-                    if not future.done():
-                        try:
-                            future.set_result(event)
-                        except asyncio.InvalidStateError:
-                            return
+                if predicate(event):
+                    future.set_result(event)
             except Exception as exc:
-                if not future.done():
-                    try:
-                        future.set_exception(exc)
-                    except asyncio.InvalidStateError:
-                        return
+                future.set_exception(exc)
 
         self.subscribe(event_type, handler)
         try:
@@ -124,11 +190,88 @@ class EventBus:
         finally:
             self.unsubscribe(handler)
 
+    async def wait_for_key(
+        self,
+        event_type: type[Any],
+        key_attr: str,
+        key_value: Any,
+        timeout: float = 60.0,
+    ) -> StructuredEvent | RemoraEvent:
+        """Wait for the next ``event_type`` event whose ``key_attr`` equals ``key_value``.
+
+        Unlike :meth:`wait_for`, waiters are indexed by key behind a single subscription per
+        event type, so outstanding waiters cost one dict lookup per event rather than a
+        predicate call each, and waiting does not churn the handler registry.
+        """
+        future: asyncio.Future[StructuredEvent | RemoraEvent] = asyncio.get_running_loop().create_future()
+        by_attr = self._keyed_waiters.get(event_type)
+        if by_attr is None:
+            by_attr = self._keyed_waiters[event_type] = {}
+            self.subscribe(event_type, self._notify_keyed_waiters)
+        by_attr.setdefault(key_attr, {}).setdefault(key_value, []).append(future)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            self._discard_keyed_waiter(event_type, key_attr, key_value, future)
+
+    def _discard_keyed_waiter(
+        self,
+        event_type: type[Any],
+        key_attr: str,
+        key_value: Any,
+        future: asyncio.Future[Any],
+    ) -> None:
+        """Drop ``future`` and prune empty entries, unsubscribing once ``event_type`` has no waiters."""
+        by_attr = self._keyed_waiters.get(event_type)
+        if by_attr is None:
+            return
+        by_value = by_attr.get(key_attr)
+        if by_value is not None:
+            futures = by_value.get(key_value)
+            if futures is not None:
+                if future in futures:
+                    futures.remove(future)
+                if not futures:
+                    del by_value[key_value]
+            if not by_value:
+                del by_attr[key_attr]
+        if by_attr:
+            return
+        del self._keyed_waiters[event_type]
+        handlers = self._handlers.get(event_type)
+        if handlers is not None and self._notify_keyed_waiters in handlers:
+            del handlers[self._notify_keyed_waiters]
+            self._invalidate(event_type)
+
+    def _notify_keyed_waiters(self, event: StructuredEvent | RemoraEvent) -> None:
+        for event_type in type(event).__mro__:
+            by_attr = self._keyed_waiters.get(event_type)
+            if by_attr is None:
+                continue
+            for key_attr, by_value in by_attr.items():
+                try:
+                    futures = by_value.pop(getattr(event, key_attr, None), ())
+                except TypeError:
+                    # Unhashable attribute values can never match a waiter's key.
+                    continue
+                for future in futures:
+                    if not future.done():
+                        future.set_result(event)
+
     def clear(self) -> None:
+        for by_attr in self._keyed_waiters.values():
+            for by_value in by_attr.values():
+                for futures in by_value.values():
+                    for future in futures:
+                        future.cancel()
         self._handlers.clear()
         self._all_handlers.clear()
+        self._dispatch_cache.clear()
+        self._keyed_waiters.clear()
+
 
 __all__ = [
     "EventBus",
     "EventHandler",
+    "emit_cached",
 ]
@@ -7,13 +7,14 @@ import json
 import logging
 import sqlite3
 import time
-from dataclasses import asdict, is_dataclass
+from dataclasses import asdict, fields, is_dataclass
 from typing import TYPE_CHECKING, Any, AsyncIterator
 
 from structured_agents.events import Event as StructuredEvent
 
 from remora.core.events import RemoraEvent
 from remora.utils import PathLike, normalize_path
+from remora.utils.serialization import PLAIN_TYPES, FieldReader, field_reader
 
 logger = logging.getLogger(__name__)
 
@@ -64,6 +65,9 @@ class EventStore:
             await asyncio.to_thread(
                 self._conn.executescript,
                 """
+                PRAGMA journal_mode=WAL;
+                PRAGMA synchronous=NORMAL;
+
                 CREATE TABLE IF NOT EXISTS events (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     graph_id TEXT NOT NULL,
@@ -234,21 +238,40 @@ class EventStore:
             rows = await asyncio.to_thread(cursor.fetchall)
 
         for row in rows:
-            tags = row["tags"]
-            if tags:
-                tags = json.loads(tags)
-            yield {
-                "id": row["id"],
-                "graph_id": row["graph_id"],
-                "event_type": row["event_type"],
-                "payload": json.loads(row["payload"]),
-                "timestamp": row["timestamp"],
-                "created_at": row["created_at"],
-                "from_agent": row["from_agent"],
-                "to_agent": row["to_agent"],
-                "correlation_id": row["correlation_id"],
-                "tags": tags,
-            }
+            yield _row_to_dict(row)
+
+    async def get_agent_events(
+        self,
+        graph_id: str,
+        agent_id: str,
+        *,
+        limit: int = 20,
+    ) -> list[dict[str, Any]]:
+        """Get the most recent events sent by, sent to, or about an agent.
+
+        Filtering and the limit are applied in SQL, so the cost follows ``limit`` rather
+        than the size of the log. Events are returned oldest first.
+        """
+        if self._conn is None:
+            await self.initialize()
+        if self._conn is None:
+            raise RuntimeError("EventStore not initialized")
+
+        async with self._lock:
+            cursor = await asyncio.to_thread(
+                self._conn.execute,
+                """
+                SELECT * FROM events
+                WHERE graph_id = ?
+                  AND (to_agent = ? OR from_agent = ? OR json_extract(payload, '$.agent_id') = ?)
+                ORDER BY id DESC
+                LIMIT ?
+                """,
+                (graph_id, agent_id, agent_id, agent_id, limit),
+            )
+            rows = await asyncio.to_thread(cursor.fetchall)
+
+        return [_row_to_dict(row) for row in reversed(rows)]
 
     async def get_graph_ids(
         self,
@@ -341,7 +364,7 @@ class EventStore:
     def _serialize_event(self, event: StructuredEvent | RemoraEvent) -> str:
         """Serialize an event to JSON."""
         if is_dataclass(event):
-            data = asdict(event)
+            data = _dataclass_fields(event)
         elif hasattr(event, "__dict__"):
             data = dict(vars(event))
         else:
@@ -350,4 +373,52 @@ class EventStore:
         return json.dumps(data, default=str)
 
 
+_FIELD_READERS: dict[type, tuple[tuple[str, ...], FieldReader]] = {}
+
+
+def _is_plain(value: Any) -> bool:
+    value_type = type(value)
+    if value_type in PLAIN_TYPES:
+        return True
+    if value_type is list or value_type is tuple:
+        return all(type(item) in PLAIN_TYPES for item in value)
+    return False
+
+
+def _dataclass_fields(event: Any) -> dict[str, Any]:
+    """Return the same mapping as ``asdict(event)`` without its deep copy in the common case.
+
+    Field names are resolved once per class. Events whose values are all scalars or flat
+    lists of scalars are read directly; anything nested still goes through ``asdict``.
+    """
+    event_cls = type(event)
+    reader = _FIELD_READERS.get(event_cls)
+    if reader is None:
+        names = tuple(f.name for f in fields(event_cls))
+        reader = _FIELD_READERS[event_cls] = (names, field_reader(names))
+    names, read_fields = reader
+    values = read_fields(event)
+    if all(map(_is_plain, values)):
+        return dict(zip(names, values, strict=True))
+    return asdict(event)
+
+
+def _row_to_dict(row: sqlite3.Row) -> dict[str, Any]:
+    tags = row["tags"]
+    if tags:
+        tags = json.loads(tags)
+    return {
+        "id": row["id"],
+        "graph_id": row["graph_id"],
+        "event_type": row["event_type"],
+        "payload": json.loads(row["payload"]),
+        "timestamp": row["timestamp"],
+        "created_at": row["created_at"],
+        "from_agent": row["from_agent"],
+        "to_agent": row["to_agent"],
+        "correlation_id": row["correlation_id"],
+        "tags": tags,
+    }
+
+
 __all__ = ["EventStore"]
@@ -10,6 +10,7 @@ This module provides the reconcile_on_startup function that:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 from pathlib import Path
@@ -69,7 +70,8 @@ async def reconcile_on_startup(
     project_path = normalize_path(project_path)
     swarm_root = project_path / ".remora"
 
-    nodes = discover(
+    nodes = await asyncio.to_thread(
+        discover,
         [project_path / p for p in (discovery_paths or ["src/"])],
         languages=languages,
     )
@@ -86,6 +88,8 @@ async def reconcile_on_startup(
 
     created = 0
     orphaned = 0
+    new_agents: list[AgentMetadata] = []
+    new_defaults: list[tuple[str, str]] = []
 
     for node_id in new_ids:
         node = node_map[node_id]
@@ -99,7 +103,7 @@ async def reconcile_on_startup(
             start_line=node.start_line,
             end_line=node.end_line,
         )
-        await swarm_state.upsert(metadata)
+        new_agents.append(metadata)
 
         agent_dir = get_agent_dir(swarm_root, node.node_id)
         agent_dir.mkdir(parents=True, exist_ok=True)
@@ -115,13 +119,14 @@ async def reconcile_on_startup(
         save_agent_state(get_agent_state_path(swarm_root, node.node_id), state)
 
         relative_path = to_project_relative(project_path, node.file_path)
-        await subscriptions.register_defaults(
-            node.node_id,
-            relative_path,
-        )
+        new_defaults.append((node.node_id, relative_path))
 
         created += 1
 
+    # One transaction per table instead of a commit per new agent.
+    await swarm_state.upsert_many(new_agents)
+    await subscriptions.register_defaults_many(new_defaults)
+
     for agent_id in deleted_ids:
         await swarm_state.mark_orphaned(agent_id)
         await subscriptions.unregister_all(agent_id)
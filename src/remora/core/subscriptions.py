@@ -9,7 +9,9 @@ from __future__ import annotations
 
 import asyncio
 import json
+import logging
 import time
+from collections.abc import Iterable
 from dataclasses import asdict, dataclass, field
 from pathlib import Path, PurePath
 from typing import TYPE_CHECKING, Any
@@ -19,6 +21,8 @@ from remora.utils import PathLike, normalize_path
 if TYPE_CHECKING:
     from remora.core.events import RemoraEvent
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class SubscriptionPattern:
@@ -82,6 +86,14 @@ class Subscription:
     created_at: float = field(default_factory=time.time)
     updated_at: float = field(default_factory=time.time)
 
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for API responses."""
+        return {
+            "id": self.id,
+            "pattern": asdict(self.pattern),
+            "is_default": self.is_default,
+        }
+
 
 class SubscriptionRegistry:
     """Registry for agent event subscriptions.
@@ -108,6 +120,8 @@ class SubscriptionRegistry:
             self._conn.row_factory = sqlite3.Row
 
             def _init_db(conn: Any) -> None:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
                 conn.execute(
                     """
                     CREATE TABLE IF NOT EXISTS subscriptions (
@@ -168,17 +182,54 @@ class SubscriptionRegistry:
         - Direct message subscription (to_agent = agent_id)
         - Source file subscription (ContentChanged for agent's file)
         """
-        subscriptions = []
+        return await self.register_defaults_many([(agent_id, file_path)])
 
-        direct_pattern = SubscriptionPattern(to_agent=agent_id)
-        sub = await self.register(agent_id, direct_pattern, is_default=True)
-        subscriptions.append(sub)
+    async def register_defaults_many(self, agents: Iterable[tuple[str, str]]) -> list[Subscription]:
+        """Register default subscriptions for several ``(agent_id, file_path)`` pairs.
 
-        file_pattern = SubscriptionPattern(event_types=["ContentChangedEvent"], path_glob=file_path)
-        sub = await self.register(agent_id, file_pattern, is_default=True)
-        subscriptions.append(sub)
+        All rows are inserted in one transaction.
+        """
+        if self._conn is None:
+            await self.initialize()
 
-        return subscriptions
+        now = time.time()
+        pending: list[tuple[str, SubscriptionPattern, str]] = []
+        for agent_id, file_path in agents:
+            for pattern in (
+                SubscriptionPattern(to_agent=agent_id),
+                SubscriptionPattern(event_types=["ContentChangedEvent"], path_glob=file_path),
+            ):
+                pending.append((agent_id, pattern, json.dumps(asdict(pattern))))
+        if not pending:
+            return []
+
+        def _exec(conn: Any) -> list[int]:
+            ids = []
+            for agent_id, _, pattern_json in pending:
+                cursor = conn.execute(
+                    """
+                    INSERT INTO subscriptions (agent_id, pattern_json, is_default, created_at, updated_at)
+                    VALUES (?, ?, 1, ?, ?)
+                    """,
+                    (agent_id, pattern_json, now, now),
+                )
+                ids.append(cursor.lastrowid)
+            conn.commit()
+            return ids
+
+        ids = await asyncio.to_thread(_exec, self._conn)
+
+        return [
+            Subscription(
+                id=subscription_id,
+                agent_id=agent_id,
+                pattern=pattern,
+                is_default=True,
+                created_at=now,
+                updated_at=now,
+            )
+            for subscription_id, (agent_id, pattern, _) in zip(ids, pending, strict=True)
+        ]
 
     async def unregister_all(self, agent_id: str) -> int:
         """Remove all subscriptions for an agent."""
@@ -242,9 +293,6 @@ class SubscriptionRegistry:
 
     async def get_matching_agents(self, event: RemoraEvent) -> list[str]:
         """Get all agent IDs whose subscriptions match the event."""
-        import logging
-        logger = logging.getLogger(__name__)
-
         if self._conn is None:
             await self.initialize()
 
@@ -65,6 +65,7 @@ class SwarmExecutor:
             project_root=project_root,
         )
         self._workspace_initialized = False
+        self._bundles: dict[Path, tuple[int, Any, str]] = {}
 
     async def run_agent(self, state: AgentState, trigger_event: Any = None) -> str:
         """Run a single agent turn.
@@ -81,7 +82,7 @@ class SwarmExecutor:
         bundle_path = self._resolve_bundle_path(state)
         logger.info(f"Resolved bundle path: {bundle_path}")
 
-        manifest = load_manifest(bundle_path)
+        manifest, model_name = await self._load_bundle(bundle_path)
         logger.info(f"Loaded manifest: {manifest.name if hasattr(manifest, 'name') else 'unknown'}")
 
         if not self._workspace_initialized:
@@ -196,7 +197,6 @@ class SwarmExecutor:
             )
         logger.info(f"Discovered {len(tools)} tools (agents_dir={manifest.agents_dir})")
 
-        model_name = self._resolve_model_name(bundle_path, manifest)
         logger.info(f"Using model: {model_name} at {self.config.model_base_url}")
         logger.info(f"Running kernel with {len(tools)} tools, prompt length={len(prompt)}")
 
@@ -244,8 +244,30 @@ class SwarmExecutor:
             return bundle_root
         return bundle_root / mapping[state.node_type]
 
+    async def _load_bundle(self, bundle_path: Path) -> tuple[Any, str]:
+        """Return the manifest and model name for ``bundle_path``.
+
+        Both are parsed once per bundle and reused across turns until ``bundle.yaml`` changes.
+        """
+        path = _bundle_file(bundle_path)
+        try:
+            mtime = path.stat().st_mtime_ns
+        except OSError:
+            mtime = -1
+        cached = self._bundles.get(bundle_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1], cached[2]
+
+        def _load() -> tuple[Any, str]:
+            manifest = load_manifest(bundle_path)
+            return manifest, self._resolve_model_name(bundle_path, manifest)
+
+        manifest, model_name = await asyncio.to_thread(_load)
+        self._bundles[bundle_path] = (mtime, manifest, model_name)
+        return manifest, model_name
+
     def _resolve_model_name(self, bundle_path: Path, manifest: Any) -> str:
-        path = bundle_path / "bundle.yaml" if bundle_path.is_dir() else bundle_path
+        path = _bundle_file(bundle_path)
         override = None
         try:
             data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
@@ -354,6 +376,10 @@ class SwarmExecutor:
         return "\n".join(sections)
 
 
+def _bundle_file(bundle_path: Path) -> Path:
+    return bundle_path / "bundle.yaml" if bundle_path.is_dir() else bundle_path
+
+
 def _state_to_cst_node(state: AgentState) -> CSTNode:
     start_line = state.range[0] if state.range else 1
     end_line = state.range[1] if state.range else 1
@@ -5,8 +5,10 @@ from __future__ import annotations
 import asyncio
 import sqlite3
 import time
+from collections.abc import Iterable
 from dataclasses import dataclass
 from pathlib import Path
+
 from remora.utils import PathLike, normalize_path
 
 
@@ -46,6 +48,8 @@ class SwarmState:
         assert self._conn is not None
         self._conn.row_factory = sqlite3.Row
 
+        await asyncio.to_thread(self._conn.execute, "PRAGMA journal_mode=WAL")
+        await asyncio.to_thread(self._conn.execute, "PRAGMA synchronous=NORMAL")
         await asyncio.to_thread(
             self._conn.execute,
             """
@@ -72,14 +76,35 @@ class SwarmState:
 
     async def upsert(self, metadata: AgentMetadata) -> None:
         """Insert or update an agent."""
+        await self.upsert_many([metadata])
+
+    async def upsert_many(self, agents: Iterable[AgentMetadata]) -> None:
+        """Insert or update several agents in a single transaction."""
         if self._conn is None:
             await self.initialize()
         assert self._conn is not None
 
         now = time.time()
+        rows = [
+            (
+                metadata.agent_id,
+                metadata.node_type,
+                metadata.name,
+                metadata.full_name,
+                metadata.file_path,
+                metadata.parent_id,
+                metadata.start_line,
+                metadata.end_line,
+                now,
+                now,
+            )
+            for metadata in agents
+        ]
+        if not rows:
+            return
 
         def _exec(conn: sqlite3.Connection) -> None:
-            conn.execute(
+            conn.executemany(
                 """
                 INSERT INTO agents (agent_id, node_type, name, full_name, file_path, parent_id, start_line, end_line, status, created_at, updated_at)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, 'active', ?, ?)
@@ -94,22 +119,11 @@ class SwarmState:
                     updated_at = excluded.updated_at,
                     status = 'active'
                 """,
-                (
-                    metadata.agent_id,
-                    metadata.node_type,
-                    metadata.name,
-                    metadata.full_name,
-                    metadata.file_path,
-                    metadata.parent_id,
-                    metadata.start_line,
-                    metadata.end_line,
-                    now,
-                    now,
-                ),
+                rows,
             )
+            conn.commit()
 
         await asyncio.to_thread(_exec, self._conn)
-        await asyncio.to_thread(self._conn.commit)
 
     async def mark_orphaned(self, agent_id: str) -> None:
         """Mark an agent as orphaned."""
@@ -168,6 +182,28 @@ class SwarmState:
 
         return self._row_to_metadata(row)
 
+    async def get_agents(self, agent_ids: Iterable[str]) -> list[AgentMetadata]:
+        """Get the agents among ``agent_ids`` in a single query; unknown IDs are skipped."""
+        ids = tuple(dict.fromkeys(agent_ids))
+        if not ids:
+            return []
+        if self._conn is None:
+            await self.initialize()
+        assert self._conn is not None
+
+        placeholders = ", ".join("?" * len(ids))
+
+        def _fetch(conn: sqlite3.Connection) -> list[sqlite3.Row]:
+            cursor = conn.execute(
+                f"SELECT * FROM agents WHERE agent_id IN ({placeholders})",
+                ids,
+            )
+            return cursor.fetchall()
+
+        rows = await asyncio.to_thread(_fetch, self._conn)
+
+        return [self._row_to_metadata(row) for row in rows]
+
     async def close(self) -> None:
         """Close the database connection."""
         if not self._conn:
@@ -8,8 +8,12 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Awaitable, Callable
+from typing import Any
 
 from cairn.runtime import workspace_manager as cairn_workspace_manager
 
@@ -20,6 +24,95 @@ from remora.utils import PathLike, PathResolver, normalize_path
 
 logger = logging.getLogger(__name__)
 
+RELATED_LOAD_CONCURRENCY = 8
+
+
+@lru_cache(maxsize=4096)
+def _resolve_disk_path(project_root: Path, path: str) -> Path:
+    """Join a project-relative ``path`` onto ``project_root``.
+
+    Only lexical path arithmetic is memoized; symlinks are left for the OS to follow when
+    the file is opened, so a retargeted or removed link takes effect immediately.
+    """
+    path_obj = normalize_path(path)
+    if path_obj.is_absolute():
+        return path_obj
+    return Path(os.path.normpath(project_root / path_obj))
+
+
+class AsyncReadWriteLock:
+    """Asyncio lock allowing many concurrent readers or a single writer.
+
+    Writers are preferred: once a writer is waiting, new readers queue behind it
+    so a steady stream of reads cannot starve writes.
+
+    Releasing never awaits, so a task cancelled inside ``reading()``/``writing()``
+    still gives the lock back. State only changes on the event loop thread between
+    awaits, and waiters re-check their condition each time they are woken.
+    """
+
+    def __init__(self) -> None:
+        self._readers = 0
+        self._writer = False
+        self._waiting_writers = 0
+        self._waiters: set[asyncio.Future[None]] = set()
+
+    async def _wait(self) -> None:
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.add(future)
+        try:
+            await future
+        finally:
+            self._waiters.discard(future)
+
+    def _wake_all(self) -> None:
+        for future in self._waiters:
+            if not future.done():
+                future.set_result(None)
+
+    async def read_acquire(self) -> None:
+        while self._writer or self._waiting_writers:
+            await self._wait()
+        self._readers += 1
+
+    def read_release(self) -> None:
+        self._readers -= 1
+        if self._readers == 0:
+            self._wake_all()
+
+    async def write_acquire(self) -> None:
+        self._waiting_writers += 1
+        try:
+            while self._writer or self._readers:
+                await self._wait()
+        except BaseException:
+            # Wake readers that were held back by this writer if it was cancelled.
+            self._waiting_writers -= 1
+            self._wake_all()
+            raise
+        self._waiting_writers -= 1
+        self._writer = True
+
+    def write_release(self) -> None:
+        self._writer = False
+        self._wake_all()
+
+    @asynccontextmanager
+    async def reading(self) -> AsyncIterator[None]:
+        await self.read_acquire()
+        try:
+            yield
+        finally:
+            self.read_release()
+
+    @asynccontextmanager
+    async def writing(self) -> AsyncIterator[None]:
+        await self.write_acquire()
+        try:
+            yield
+        finally:
+            self.write_release()
+
 
 class AgentWorkspace:
     """Workspace for a single agent execution.
@@ -34,14 +127,14 @@ class AgentWorkspace:
         stable_workspace: Any | None = None,
         *,
         ensure_file_synced: Callable[[str], Awaitable[bool]] | None = None,
-        lock: asyncio.Lock | None = None,
-        stable_lock: asyncio.Lock | None = None,
+        lock: AsyncReadWriteLock | None = None,
+        stable_lock: AsyncReadWriteLock | None = None,
     ):
         self._workspace = workspace
         self._agent_id = agent_id
         self._stable_workspace = stable_workspace
         self._ensure_file_synced = ensure_file_synced
-        self._lock = lock or asyncio.Lock()
+        self._lock = lock or AsyncReadWriteLock()
         if stable_workspace is not None:
             self._stable_lock = stable_lock or self._lock
         else:
@@ -56,12 +149,12 @@ class AgentWorkspace:
         """Read a file from the workspace."""
         path_str = normalize_path(path).as_posix()
         try:
-            async with self._lock:
+            async with self._lock.reading():
                 return await self._workspace.files.read(path_str, mode="text")
         except Exception as exc:
             if not _is_missing_file_error(exc) or self._stable_workspace is None:
                 raise
-        async with self._stable_lock:
+        async with self._stable_lock.reading():
             try:
                 return await self._stable_workspace.files.read(path_str, mode="text")
             except Exception as exc:
@@ -70,35 +163,35 @@ class AgentWorkspace:
 
         if self._ensure_file_synced is not None:
             await self._ensure_file_synced(path_str)
-            async with self._stable_lock:
+            async with self._stable_lock.reading():
                 return await self._stable_workspace.files.read(path_str, mode="text")
         raise FileNotFoundError(path_str)
 
     async def write(self, path: PathLike, content: str | bytes) -> None:
         """Write a file to the workspace (CoW isolated)."""
         path_str = normalize_path(path).as_posix()
-        async with self._lock:
+        async with self._lock.writing():
             await self._workspace.files.write(path_str, content)
 
     async def exists(self, path: PathLike) -> bool:
         """Check if a file exists in the workspace."""
         path_str = normalize_path(path).as_posix()
-        async with self._lock:
+        async with self._lock.reading():
             if await self._workspace.files.exists(path_str):
                 return True
         if self._stable_workspace is None:
             return False
-        async with self._stable_lock:
+        async with self._stable_lock.reading():
             return await self._stable_workspace.files.exists(path_str)
 
     async def list_dir(self, path: PathLike = ".") -> list[str]:
         """List directory entries in the workspace."""
         path_str = normalize_path(path).as_posix()
-        async with self._lock:
+        async with self._lock.reading():
             entries = set(await self._workspace.files.list_dir(path_str, output="name"))
         if self._stable_workspace is not None:
             try:
-                async with self._stable_lock:
+                async with self._stable_lock.reading():
                     stable_entries = await self._stable_workspace.files.list_dir(path_str, output="name")
             except Exception:
                 stable_entries = []
@@ -129,7 +222,7 @@ class CairnDataProvider:
             if node.file_path != target_path:
                 files[node.file_path] = content
         except Exception as e:
-            fallback_content = self._load_from_disk(node.file_path)
+            fallback_content = await self._load_from_disk(node.file_path)
             if fallback_content is not None:
                 files[target_path] = fallback_content
                 if node.file_path != target_path:
@@ -143,29 +236,35 @@ class CairnDataProvider:
                 logger.warning("Could not load target file %s: %s", node.file_path, e)
 
         if related:
-            for path in related:
-                try:
-                    workspace_path = self._resolver.to_workspace_path(path)
-                    if await self._workspace.exists(workspace_path):
-                        content = await self._workspace.read(workspace_path)
-                        files[workspace_path] = content
-                        if path != workspace_path:
-                            files[path] = content
-                except Exception as e:
-                    logger.debug("Could not load related file %s: %s", path, e)
+            semaphore = asyncio.Semaphore(RELATED_LOAD_CONCURRENCY)
+            results = await asyncio.gather(*(self._load_related(path, semaphore) for path in related))
+            for path, workspace_path, content in results:
+                if content is None:
+                    continue
+                files[workspace_path] = content
+                if path != workspace_path:
+                    files[path] = content
 
         return files
 
+    async def _load_related(self, path: str, semaphore: asyncio.Semaphore) -> tuple[str, str, str | None]:
+        workspace_path = path
+        async with semaphore:
+            try:
+                workspace_path = self._resolver.to_workspace_path(path)
+                return path, workspace_path, await self._workspace.read(workspace_path)
+            except Exception as e:
+                if not _is_missing_file_error(e):
+                    logger.debug("Could not load related file %s: %s", path, e)
+        return path, workspace_path, None
+
     def _resolve_disk_path(self, path: str) -> Path:
-        path_obj = normalize_path(path)
-        if not path_obj.is_absolute():
-            path_obj = (self._resolver.project_root / path_obj).resolve()
-        return path_obj
+        return _resolve_disk_path(self._resolver.project_root, path)
 
-    def _load_from_disk(self, path: str) -> str | None:
+    async def _load_from_disk(self, path: str) -> str | None:
         try:
             disk_path = self._resolve_disk_path(path)
-            return disk_path.read_text(encoding="utf-8")
+            return await asyncio.to_thread(disk_path.read_text, encoding="utf-8")
         except OSError as exc:
             logger.debug("Fallback read failed for %s: %s", path, exc)
             return None
@@ -173,6 +272,7 @@ class CairnDataProvider:
 
 __all__ = [
     "AgentWorkspace",
+    "AsyncReadWriteLock",
     "CairnDataProvider",
 ]
 
@@ -3,16 +3,25 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
-from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from dataclasses import dataclass, field, fields, is_dataclass
+from typing import TYPE_CHECKING, Any
+
+from remora.ui.projector import normalize_event
+from remora.utils import field_reader, json_dumpb
+from remora.utils.serialization import FieldReader
 
 if TYPE_CHECKING:
     from remora.core.events import RemoraEvent
 
 logger = logging.getLogger(__name__)
 
+OUT_QUEUE_SIZE = 1024
+WRITE_BATCH_SIZE = 64
+
+# The JSON-RPC envelope never changes; only the params are encoded per event.
+_PUSH_PREFIX = b'{"jsonrpc":"2.0","method":"event.push","params":'
+
 
 @dataclass
 class NvimClient:
@@ -21,48 +30,72 @@ class NvimClient:
     writer: asyncio.StreamWriter
     subscribed_agents: set[str] = field(default_factory=set)
     client_id: str = ""
+    out_queue: asyncio.Queue[bytes] = field(default_factory=lambda: asyncio.Queue(maxsize=OUT_QUEUE_SIZE))
+    writer_task: asyncio.Task[None] | None = None
 
     def __post_init__(self):
         if not self.client_id:
             self.client_id = f"nvim_{id(self)}"
 
+    def push(self, msg: bytes) -> None:
+        """Queue ``msg`` for the writer task, dropping the oldest message when full."""
+        if self.out_queue.full():
+            self.out_queue.get_nowait()
+        self.out_queue.put_nowait(msg)
+
+    async def run_writer(self) -> None:
+        """Send queued messages, coalescing whatever is already pending."""
+        try:
+            while True:
+                batch = [await self.out_queue.get()]
+                while len(batch) < WRITE_BATCH_SIZE and not self.out_queue.empty():
+                    batch.append(self.out_queue.get_nowait())
+                self.writer.writelines(batch)
+                await self.writer.drain()
+        except (ConnectionError, RuntimeError) as e:
+            logger.warning(f"Failed to push to {self.client_id}: {e}")
+
 
 class ClientManager:
-    """Manages all connected Neovim clients."""
+    """Manages all connected Neovim clients.
+
+    All bookkeeping happens on the event loop without awaiting in between, so no lock is
+    needed; broadcasts iterate a snapshot of the subscribers.
+    """
 
     def __init__(self):
         self._clients: dict[str, NvimClient] = {}
-        self._lock = asyncio.Lock()
+        # agent_id -> {client_id: client}, so a push only visits subscribed clients.
+        self._by_agent: dict[str, dict[str, NvimClient]] = {}
 
     async def register(self, writer: asyncio.StreamWriter) -> NvimClient:
         """Register a new Neovim client."""
         client = NvimClient(writer=writer)
-        async with self._lock:
-            self._clients[client.client_id] = client
+        client.writer_task = asyncio.create_task(client.run_writer())
+        self._clients[client.client_id] = client
         logger.info(f"Client {client.client_id} connected")
         return client
 
     async def unregister(self, client: NvimClient) -> None:
         """Unregister a disconnected client."""
-        async with self._lock:
-            self._clients.pop(client.client_id, None)
+        self._clients.pop(client.client_id, None)
+        self._unindex(client)
+        if client.writer_task is not None:
+            client.writer_task.cancel()
         logger.info(f"Client {client.client_id} disconnected")
 
     async def subscribe(self, client: NvimClient, agent_id: str) -> None:
         """Subscribe a client to an agent's events."""
-        async with self._lock:
-            client.subscribed_agents.clear()
-            client.subscribed_agents.add(agent_id)
+        self._unindex(client)
+        client.subscribed_agents.clear()
+        client.subscribed_agents.add(agent_id)
+        self._by_agent.setdefault(agent_id, {})[client.client_id] = client
         logger.info(f"Client {client.client_id} subscribed to agent {agent_id}")
 
     async def notify_event(self, event: RemoraEvent) -> None:
         """Push an event to all clients subscribed to the relevant agent."""
         event_type = type(event).__name__
-        agent_id = (
-            getattr(event, "agent_id", None)
-            or getattr(event, "to_agent", None)
-            or getattr(event, "from_agent", None)
-        )
+        agent_id = event_agent_id(event)
 
         logger.info(f"notify_event: {event_type} agent_id={agent_id}")
 
@@ -70,46 +103,65 @@ class ClientManager:
             logger.warning(f"notify_event: Skipping {event_type} - no agent_id")
             return
 
-        notification = {
-            "jsonrpc": "2.0",
-            "method": "event.push",
-            "params": {
-                "agent_id": agent_id,
-                "event_type": type(event).__name__,
-                "timestamp": getattr(event, "timestamp", None),
-                "data": self._serialize_event(event),
-            },
+        params = {
+            "agent_id": agent_id,
+            "event_type": event_type,
+            "timestamp": getattr(event, "timestamp", None),
+            "data": self._serialize_event(event),
         }
-        msg = json.dumps(notification).encode() + b"\n"
+        msg = b"".join((_PUSH_PREFIX, json_dumpb(params), b"}\n"))
 
-        async with self._lock:
-            all_clients = list(self._clients.values())
-            clients_to_notify = [
-                c for c in all_clients if agent_id in c.subscribed_agents
-            ]
+        clients_to_notify = tuple(self._by_agent.get(agent_id, {}).values())
 
-        logger.info(f"notify_event: {len(all_clients)} clients connected, {len(clients_to_notify)} subscribed to {agent_id}")
-        for c in all_clients:
-            logger.debug(f"  Client {c.client_id} subscribed to: {c.subscribed_agents}")
+        logger.info(f"notify_event: {len(self._clients)} clients connected, {len(clients_to_notify)} subscribed to {agent_id}")
 
         for client in clients_to_notify:
-            try:
-                client.writer.write(msg)
-                await client.writer.drain()
-                logger.info(f"Pushed {event_type} to {client.client_id}")
-            except Exception as e:
-                logger.warning(f"Failed to push to {client.client_id}: {e}")
+            client.push(msg)
+            logger.info(f"Queued {event_type} for {client.client_id}")
+
+    def _unindex(self, client: NvimClient) -> None:
+        for agent_id in client.subscribed_agents:
+            subscribers = self._by_agent.get(agent_id)
+            if subscribers is None:
+                continue
+            subscribers.pop(client.client_id, None)
+            if not subscribers:
+                del self._by_agent[agent_id]
 
     def _serialize_event(self, event: RemoraEvent) -> dict:
-        """Convert event to JSON-serializable dict."""
-        from dataclasses import asdict, is_dataclass
-
-        if is_dataclass(event):
-            return asdict(event)
-        elif hasattr(event, "__dict__"):
-            return dict(vars(event))
-        else:
-            return {"value": str(event)}
+        """Convert event to JSON-serializable dict.
+
+        Uses the projector's per-class serializers instead of ``dataclasses.asdict``.
+        """
+        return normalize_event(event)["payload"]
+
+
+_AGENT_FIELDS = ("agent_id", "to_agent", "from_agent")
+_AGENT_GETTERS: dict[type, FieldReader] = {}
+
+
+def _agent_getter(event_cls: type) -> FieldReader:
+    if is_dataclass(event_cls):
+        declared = {f.name for f in fields(event_cls)}
+        return field_reader(tuple(name for name in _AGENT_FIELDS if name in declared))
+    # Without declared fields there is nothing class-wide to resolve; read each instance.
+    return lambda event: tuple(getattr(event, name, None) for name in _AGENT_FIELDS)
+
+
+def event_agent_id(event: Any) -> str | None:
+    """Return the first set of ``agent_id``/``to_agent``/``from_agent`` on ``event``.
+
+    For dataclass events, which of those fields the class declares is resolved once per
+    class, so events only pay for reading the ones that exist.
+    """
+    event_cls = type(event)
+    getter = _AGENT_GETTERS.get(event_cls)
+    if getter is None:
+        getter = _AGENT_GETTERS[event_cls] = _agent_getter(event_cls)
+    for value in getter(event):
+        if value:
+            return value
+    return None
 
 
 # Global instance
@@ -5,7 +5,10 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
 from contextlib import asynccontextmanager
+from operator import attrgetter, itemgetter
 from pathlib import Path
 
 
@@ -26,8 +29,8 @@ from remora.core.events import RemoraEvent, AgentMessageEvent
 from remora.core.reconciler import get_agent_state_path, reconcile_on_startup
 from remora.core.subscriptions import SubscriptionRegistry
 from remora.core.swarm_state import AgentMetadata, SwarmState
-from remora.demo.client_manager import ClientManager, NvimClient
-from remora.utils import normalize_path
+from remora.demo.client_manager import ClientManager, NvimClient, event_agent_id
+from remora.utils import json_dumpb, normalize_path
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -42,6 +45,8 @@ event_store = EventStore(db_path, subscriptions=subscriptions, event_bus=event_b
 client_manager = ClientManager()
 
 SOCKET_PATH = getattr(config, "nvim_socket", "/run/user/1000/remora.sock")
+SSE_QUEUE_SIZE = 1024
+BUFFER_CACHE_SIZE = 256
 
 
 print(f"\nNvim RPC Server will listen on Unix Socket: {SOCKET_PATH}\n")
@@ -140,7 +145,7 @@ async def handle_nvim_client(reader: asyncio.StreamReader, writer: asyncio.Strea
                 break
 
             try:
-                request = json.loads(line.decode())
+                request = json.loads(line)
             except json.JSONDecodeError as exc:
                 logger.warning("Invalid JSON from %s: %s", client.client_id, exc)
                 continue
@@ -153,7 +158,7 @@ async def handle_nvim_client(reader: asyncio.StreamReader, writer: asyncio.Strea
 
             if msg_id is not None:
                 response = {"jsonrpc": "2.0", "id": msg_id, "result": result}
-                writer.write(json.dumps(response).encode() + b"\n")
+                writer.write(json_dumpb(response) + b"\n")
                 await writer.drain()
 
     except asyncio.CancelledError:
@@ -168,17 +173,10 @@ async def handle_nvim_client(reader: asyncio.StreamReader, writer: asyncio.Strea
 
 async def handle_rpc_method(client: NvimClient, method: str, params: dict) -> dict:
     """Dispatch JSON-RPC requests from Neovim."""
-    if method == "agent.select":
-        return await rpc_agent_select(params)
-    if method == "agent.subscribe":
-        return await rpc_agent_subscribe(client, params)
-    if method == "agent.chat":
-        return await rpc_agent_chat(params)
-    if method == "buffer.opened":
-        return await rpc_buffer_opened(params)
-    if method == "agent.get_events":
-        return await rpc_get_events(params)
-    return {"error": f"Unknown method: {method}"}
+    handler = _RPC_HANDLERS.get(method)
+    if handler is None:
+        return {"error": f"Unknown method: {method}"}
+    return await handler(client, params)
 
 
 async def rpc_agent_select(params: dict) -> dict:
@@ -246,6 +244,20 @@ async def rpc_agent_chat(params: dict) -> dict:
     return {"event_id": event_id, "status": "sent"}
 
 
+# path -> (mtime_ns, registered agents), least recently opened first.
+_buffer_cache: OrderedDict[str, tuple[int, list[dict]]] = OrderedDict()
+
+
+async def _agents_still_active(registered: list[dict]) -> bool:
+    """Whether every cached agent is still active, i.e. not orphaned or wiped since it was cached.
+
+    Subscriptions are removed together with their agents, so this covers them too.
+    """
+    agent_ids = {entry["agent_id"] for entry in registered}
+    agents = await swarm_state.get_agents(agent_ids)
+    return {agent.agent_id for agent in agents if agent.status == "active"} == agent_ids
+
+
 async def rpc_buffer_opened(params: dict) -> dict:
     file_path = params.get("path")
     if not file_path:
@@ -257,8 +269,19 @@ async def rpc_buffer_opened(params: dict) -> dict:
     if path.suffix != ".py":
         return {"agents": [], "message": "Only Python files supported"}
 
+    # Reopening an unchanged buffer re-registers the same agents, so skip the parse and
+    # the database writes entirely, as long as those agents have not been removed since.
+    cache_key = str(path)
+    mtime = path.stat().st_mtime_ns
+    cached = _buffer_cache.get(cache_key)
+    if cached is not None and cached[0] == mtime and await _agents_still_active(cached[1]):
+        _buffer_cache.move_to_end(cache_key)
+        return {"agents": cached[1]}
+
     try:
-        nodes = parse_file(path)
+        # Parse off the event loop so SSE clients and pushes keep flowing. One buffer is
+        # parsed at a time, so a worker thread is enough and needs no process start-up.
+        nodes = await asyncio.to_thread(parse_file, path)
     except Exception as exc:
         logger.error("Failed to parse %s: %s", file_path, exc)
         return {"error": str(exc)}
@@ -267,6 +290,7 @@ async def rpc_buffer_opened(params: dict) -> dict:
     swarm_root = project_root / ".remora"
 
     registered = []
+    agents: list[AgentMetadata] = []
     for node in nodes:
         agent_id = compute_agent_id(node, path)
         metadata = AgentMetadata(
@@ -281,7 +305,7 @@ async def rpc_buffer_opened(params: dict) -> dict:
             status="active",
         )
 
-        await swarm_state.upsert(metadata)
+        agents.append(metadata)
 
         state_path = get_agent_state_path(swarm_root, agent_id)
         if not state_path.exists():
@@ -296,8 +320,6 @@ async def rpc_buffer_opened(params: dict) -> dict:
             save_agent_state(state_path, state)
             logger.info("Created agent state file %s", state_path)
 
-        await subscriptions.register_defaults(agent_id, str(path))
-
         registered.append(
             {
                 "agent_id": agent_id,
@@ -307,7 +329,14 @@ async def rpc_buffer_opened(params: dict) -> dict:
             }
         )
 
+    await swarm_state.upsert_many(agents)
+    await subscriptions.register_defaults_many((agent.agent_id, str(path)) for agent in agents)
+
     logger.info("Registered %d agents from %s", len(registered), file_path)
+    _buffer_cache[cache_key] = (mtime, registered)
+    _buffer_cache.move_to_end(cache_key)
+    if len(_buffer_cache) > BUFFER_CACHE_SIZE:
+        _buffer_cache.popitem(last=False)
 
     return {"agents": registered}
 
@@ -318,18 +347,19 @@ async def rpc_get_events(params: dict) -> dict:
     if not agent_id:
         return {"error": "Missing agent_id"}
 
-    events: list[dict] = []
-    async for event in event_store.replay(config.swarm_id):
-        if (
-            event.get("to_agent") == agent_id
-            or event.get("from_agent") == agent_id
-            or event.get("payload", {}).get("agent_id") == agent_id
-        ):
-            events.append(event)
-            if len(events) >= limit:
-                break
+    events = await event_store.get_agent_events(config.swarm_id, agent_id, limit=limit)
+    return {"events": events}
 
-    return {"events": events[-limit:]}
+
+RpcHandler = Callable[[NvimClient, dict], Awaitable[dict]]
+
+_RPC_HANDLERS: dict[str, RpcHandler] = {
+    "agent.select": lambda client, params: rpc_agent_select(params),
+    "agent.subscribe": rpc_agent_subscribe,
+    "agent.chat": lambda client, params: rpc_agent_chat(params),
+    "buffer.opened": lambda client, params: rpc_buffer_opened(params),
+    "agent.get_events": lambda client, params: rpc_get_events(params),
+}
 
 
 def compute_agent_id(node: CSTNode, file_path: Path) -> str:
@@ -368,10 +398,7 @@ async def get_agent_detail(agent_id: str):
         return {"error": "Agent not found"}
 
     subs = await subscriptions.get_subscriptions(agent_id)
-    events: list[dict] = []
-    async for event in event_store.replay(config.swarm_id):
-        if event.get("to_agent") == agent_id or event.get("from_agent") == agent_id:
-            events.append(event)
+    events = await event_store.get_agent_events(config.swarm_id, agent_id, limit=20)
 
     return {
         "agent": {
@@ -385,7 +412,7 @@ async def get_agent_detail(agent_id: str):
             "status": agent.status,
         },
         "subscriptions": [{"id": sub.id, "is_default": sub.is_default} for sub in subs],
-        "recent_events": events[-20:],
+        "recent_events": events,
     }
 
 
@@ -420,45 +447,29 @@ async def stream_events(request: Request):
         yield ServerSentEventGenerator.patch_elements(
             '<div id="logs" data-prepend><li>Connected to Swarm EventBus...</li></div>'
         )
-        queue: asyncio.Queue[RemoraEvent] = asyncio.Queue()
+        queue: asyncio.Queue[RemoraEvent] = asyncio.Queue(maxsize=SSE_QUEUE_SIZE)
 
-        async def handler(event: RemoraEvent):
-            await queue.put(event)
+        def handler(event: RemoraEvent) -> None:
+            # A browser that falls behind loses its oldest events instead of growing the queue.
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(event)
 
         event_bus.subscribe_all(handler)
 
         try:
             while True:
-                event = await queue.get()
-                event_type = type(event).__name__
-                agent_id = (
-                    getattr(event, "agent_id", None)
-                    or getattr(event, "to_agent", None)
-                    or getattr(event, "from_agent", None)
-                    or "system"
+                # Block for the first event, then take everything else already queued so a
+                # burst goes out as a single SSE frame.
+                batch = [await queue.get()]
+                while True:
+                    try:
+                        batch.append(queue.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
+                yield ServerSentEventGenerator.patch_elements(
+                    '<div id="logs" data-prepend>' + "".join(map(_render_log_entry, reversed(batch))) + "</div>"
                 )
-
-                if event_type == "ToolCallEvent":
-                    tool_name = getattr(event, "tool_name", "unknown")
-                    detail = f"Tool: {tool_name}"
-                elif event_type == "ModelResponseEvent":
-                    detail = f"Response: {(getattr(event, 'content', '') or '')[:50]}..."
-                elif event_type == "AgentMessageEvent":
-                    detail = f"Message: {(getattr(event, 'content', '') or '')[:50]}..."
-                else:
-                    detail = ""
-
-                html = f"""
-                    <div id="logs" data-prepend>
-                        <li class="log-entry">
-                            <span class="event-type">[{event_type}]</span>
-                            <span class="agent-id">{agent_id}</span>
-                            <span class="detail">{detail}</span>
-                        </li>
-                    </div>
-                """
-
-                yield ServerSentEventGenerator.patch_elements(html)
         except asyncio.CancelledError:
             event_bus.unsubscribe(handler)
 
@@ -473,6 +484,29 @@ async def stream_events(request: Request):
     )
 
 
+def _render_log_entry(event: RemoraEvent) -> str:
+    event_type = type(event).__name__
+    agent_id = event_agent_id(event) or "system"
+
+    if event_type == "ToolCallEvent":
+        tool_name = getattr(event, "tool_name", "unknown")
+        detail = f"Tool: {tool_name}"
+    elif event_type == "ModelResponseEvent":
+        detail = f"Response: {(getattr(event, 'content', '') or '')[:50]}..."
+    elif event_type == "AgentMessageEvent":
+        detail = f"Message: {(getattr(event, 'content', '') or '')[:50]}..."
+    else:
+        detail = ""
+
+    return f"""
+                        <li class="log-entry">
+                            <span class="event-type">[{event_type}]</span>
+                            <span class="agent-id">{agent_id}</span>
+                            <span class="detail">{detail}</span>
+                        </li>
+    """
+
+
 def build_agent_tree(agents: list[AgentMetadata]) -> list[dict]:
     by_file: dict[str, list[AgentMetadata]] = {}
     for agent in agents:
@@ -481,35 +515,49 @@ def build_agent_tree(agents: list[AgentMetadata]) -> list[dict]:
     tree = []
     for file_path, file_agents in by_file.items():
         agents_by_id = {a.agent_id: a for a in file_agents}
-        children_map: dict[str | None, list[AgentMetadata]] = {None: []}
 
+        # Agents whose parent is not in this file are roots (keyed under None).
+        children_map: dict[str | None, list[AgentMetadata]] = {}
         for agent in file_agents:
-            parent_id = agent.parent_id
+            parent_id = agent.parent_id if agent.parent_id in agents_by_id else None
             children_map.setdefault(parent_id, []).append(agent)
-
-        def build_node(agent: AgentMetadata) -> dict:
-            children = children_map.get(agent.agent_id, [])
-            return {
-                "id": agent.agent_id,
-                "name": agent.name,
-                "type": agent.node_type,
-                "line": agent.start_line,
-                "children": [build_node(child) for child in sorted(children, key=lambda x: x.start_line)],
-            }
-
-        roots = [agent for agent in file_agents if agent.parent_id is None or agent.parent_id not in agents_by_id]
-
+        for children in children_map.values():
+            children.sort(key=_START_LINE)
+
+        # Build top-down with an explicit stack; each node is created once and filled in place.
+        roots: list[dict] = []
+        pending = [(roots, children_map.get(None, []))]
+        while pending:
+            siblings, members = pending.pop()
+            for agent in members:
+                node = {
+                    "id": agent.agent_id,
+                    "name": agent.name,
+                    "type": agent.node_type,
+                    "line": agent.start_line,
+                    "children": [],
+                }
+                siblings.append(node)
+                children = children_map.get(agent.agent_id)
+                if children:
+                    pending.append((node["children"], children))
+
+        path = Path(file_path)
         file_node = {
-            "id": f"file_{Path(file_path).stem}",
-            "name": Path(file_path).name,
+            "id": f"file_{path.stem}",
+            "name": path.name,
             "type": "file",
             "path": file_path,
-            "children": [build_node(r) for r in sorted(roots, key=lambda x: x.start_line)],
+            "children": roots,
         }
 
         tree.append(file_node)
 
-    return sorted(tree, key=lambda x: x["name"])
+    return sorted(tree, key=_NAME)
+
+
+_START_LINE = attrgetter("start_line")
+_NAME = itemgetter("name")
 
 
 if __name__ == "__main__":
@@ -21,9 +21,14 @@ def main(
     runner = AgentRunner(server=server)
     server.runner = runner
 
+    background_tasks: set[asyncio.Task] = set()
+
     @server.feature(lsp.INITIALIZED)
     async def _on_initialized(params: lsp.InitializedParams) -> None:
-        asyncio.ensure_future(runner.run_forever())
+        # The event loop only keeps weak references to tasks; hold one until it finishes.
+        task = asyncio.ensure_future(runner.run_forever())
+        background_tasks.add(task)
+        task.add_done_callback(background_tasks.discard)
 
     server.start_io()
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import atexit
 import logging
 import time
@@ -11,6 +12,8 @@ from lsprotocol import types as lsp
 from pygls.lsp.server import LanguageServer
 from pygls.uris import to_fs_path
 
+from remora.core.config import Config, load_config
+from remora.core.tools.grail import discover_grail_tools
 from remora.lsp.db import RemoraDB
 from remora.lsp.graph import LazyGraph
 from remora.lsp.models import ASTAgentNode, RewriteProposal, ToolSchema
@@ -37,6 +40,16 @@ class RemoraLanguageServer(LanguageServer):
         self.event_store = event_store
         self.subscriptions = subscriptions
         self.swarm_state = swarm_state
+        self._config: Config | None = None
+        self._config_lock = asyncio.Lock()
+
+    async def get_config(self) -> Config:
+        """Load the Remora config once, off the event loop."""
+        if self._config is None:
+            async with self._config_lock:
+                if self._config is None:
+                    self._config = await asyncio.to_thread(load_config)
+        return self._config
 
     def generate_correlation_id(self) -> str:
         self._correlation_counter += 1
@@ -84,10 +97,7 @@ class RemoraLanguageServer(LanguageServer):
 
     async def discover_tools_for_agent(self, agent: ASTAgentNode) -> list[ToolSchema]:
         try:
-            from remora.core.config import load_config
-            from remora.core.tools.grail import discover_grail_tools
-
-            config = load_config()
+            config = await self.get_config()
             bundle_name = config.bundle_mapping.get(agent.node_type)
             if not bundle_name:
                 return []
@@ -9,6 +9,7 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import socket
 from dataclasses import asdict
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -17,13 +18,21 @@ import remora.core.events as events_module
 from remora.core.event_store import EventStore
 from remora.core.events import AgentMessageEvent
 from remora.core.subscriptions import SubscriptionPattern, SubscriptionRegistry
-from remora.utils import PathLike, normalize_path, to_project_relative
+from remora.ui.projector import normalize_event
+from remora.utils import PathLike, json_dumpb, normalize_path, to_project_relative
 
 if TYPE_CHECKING:
     from remora.core.event_bus import EventBus
 
 logger = logging.getLogger(__name__)
 
+CLIENT_QUEUE_SIZE = 1024
+WRITE_BATCH_SIZE = 64
+SEND_BUFFER_SIZE = 1 << 20
+
+# The notification envelope never changes; only the params are encoded per event.
+_EVENT_PREFIX = b'{"method":"event.subscribed","params":'
+
 
 class NvimServer:
     """JSON-RPC server for Neovim integration."""
@@ -43,7 +52,7 @@ class NvimServer:
         self._event_bus = event_bus
         self._project_root = normalize_path(project_root or Path.cwd())
         self._swarm_id = swarm_id
-        self._clients: set[asyncio.StreamWriter] = set()
+        self._clients: dict[asyncio.StreamWriter, asyncio.Queue[bytes]] = {}
         self._server: asyncio.Server | None = None
         self._handlers = {
             "swarm.emit": self._handle_swarm_emit,
@@ -92,7 +101,10 @@ class NvimServer:
         writer: asyncio.StreamWriter,
     ) -> None:
         """Handle a client connection."""
-        self._clients.add(writer)
+        outbox: asyncio.Queue[bytes] = asyncio.Queue(maxsize=CLIENT_QUEUE_SIZE)
+        self._clients[writer] = outbox
+        _enlarge_send_buffer(writer)
+        sender = asyncio.create_task(_send_outbox(writer, outbox))
         addr = writer.get_extra_info("peername")
         logger.debug(f"Client connected: {addr}")
 
@@ -103,10 +115,10 @@ class NvimServer:
                     break
 
                 try:
-                    message = json.loads(line.decode())
+                    message = json.loads(line)
                     response = await self._process_message(message)
                     if response:
-                        writer.write((json.dumps(response) + "\n").encode())
+                        writer.write(json_dumpb(response) + b"\n")
                         await writer.drain()
                 except json.JSONDecodeError:
                     logger.warning("Invalid JSON received")
@@ -116,7 +128,8 @@ class NvimServer:
         except asyncio.CancelledError:
             pass
         finally:
-            self._clients.discard(writer)
+            self._clients.pop(writer, None)
+            sender.cancel()
             writer.close()
             await writer.wait_closed()
             logger.debug(f"Client disconnected: {addr}")
@@ -181,20 +194,7 @@ class NvimServer:
         subscriptions = await self._subscriptions.get_subscriptions(agent_id)
         return {
             "agent_id": agent_id,
-            "subscriptions": [
-                {
-                    "id": sub.id,
-                    "pattern": {
-                        "event_types": sub.pattern.event_types,
-                        "from_agents": sub.pattern.from_agents,
-                        "to_agent": sub.pattern.to_agent,
-                        "path_glob": sub.pattern.path_glob,
-                        "tags": sub.pattern.tags,
-                    },
-                    "is_default": sub.is_default,
-                }
-                for sub in subscriptions
-            ],
+            "subscriptions": [sub.to_dict() for sub in subscriptions],
         }
 
     async def _handle_agent_chat(self, params: dict[str, Any]) -> dict[str, Any]:
@@ -242,23 +242,51 @@ class NvimServer:
         subscriptions = await self._subscriptions.get_subscriptions(agent_id)
         return {"subscriptions": [{"id": sub.id, "pattern": asdict(sub.pattern)} for sub in subscriptions]}
 
-    async def _broadcast_event(self, event: Any) -> None:
-        """Broadcast an event to all connected clients."""
-        event_type = type(event).__name__
+    def _broadcast_event(self, event: Any) -> None:
+        """Queue an event for every connected client.
+
+        Each client has its own bounded outbox drained by a sender task, so a slow client
+        loses its oldest pending events instead of stalling the broadcast.
+        """
+        envelope = normalize_event(event)
         payload = {
-            "event_type": event_type,
-            "data": {k: v for k, v in vars(event).items() if not k.startswith("_")},
+            "event_type": envelope["type"],
+            "data": envelope["payload"],
         }
 
-        message = json.dumps({"method": "event.subscribed", "params": payload}) + "\n"
-
-        for client in list(self._clients):
-            try:
-                client.write(message.encode())
-                await client.drain()
-            except Exception:
-                pass
-
+        data = b"".join((_EVENT_PREFIX, json_dumpb(payload), b"}\n"))
+        for outbox in self._clients.values():
+            if outbox.full():
+                outbox.get_nowait()
+            outbox.put_nowait(data)
+
+
+def _enlarge_send_buffer(writer: asyncio.StreamWriter) -> None:
+    """Let a burst of notifications fit in the kernel buffer instead of hitting EAGAIN.
+
+    Nagle and corking are TCP-only; on a Unix socket the send buffer size is the knob that
+    decides how much a batched write can hand off in one call.
+    """
+    sock = writer.get_extra_info("socket")
+    if sock is None:
+        return
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SEND_BUFFER_SIZE)
+    except OSError as exc:
+        logger.debug("Could not enlarge client send buffer: %s", exc)
+
+
+async def _send_outbox(writer: asyncio.StreamWriter, outbox: asyncio.Queue[bytes]) -> None:
+    """Write queued messages to ``writer``, coalescing whatever is already pending."""
+    try:
+        while True:
+            batch = [await outbox.get()]
+            while len(batch) < WRITE_BATCH_SIZE and not outbox.empty():
+                batch.append(outbox.get_nowait())
+            writer.writelines(batch)
+            await writer.drain()
+    except (ConnectionError, RuntimeError) as exc:
+        logger.debug("Stopped sending to client: %s", exc)
 
 
 __all__ = ["NvimServer"]
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, AsyncIterator, TYPE_CHECKING
 
@@ -13,7 +15,7 @@ from remora.core.subscriptions import SubscriptionRegistry
 from remora.core.swarm_state import SwarmState
 from remora.core.cairn_bridge import CairnWorkspaceService
 from remora.models import ConfigSnapshot, InputResponse
-from remora.service.datastar import render_patch, render_shell
+from remora.service.datastar import render_elements_patch, render_panel_patches, render_shell
 from remora.service.handlers import (
     ServiceDeps,
     handle_config_snapshot,
@@ -25,9 +27,12 @@ from remora.service.handlers import (
     handle_ui_snapshot,
 )
 from remora.ui.projector import UiStateProjector, normalize_event
-from remora.utils import PathLike, normalize_path
+from remora.utils import PathLike, json_dumpb, normalize_path
 from remora.ui.view import render_dashboard
 
+CLIENT_QUEUE_SIZE = 256
+PATCH_DEBOUNCE_SECONDS = 0.05
+
 
 class RemoraService:
     """Framework-agnostic Remora service API."""
@@ -96,7 +101,11 @@ class RemoraService:
         self._subscriptions = subscriptions
         self._workspace_service = workspace_service
         self._bundle_default = _resolve_bundle_default(self._config)
-        self._event_bus.subscribe_all(self._projector.record)
+        self._patch_queues: set[asyncio.Queue[None]] = set()
+        self._event_queues: set[asyncio.Queue[bytes]] = set()
+        self._dashboard_cache: tuple[int, str] | None = None
+        self._panel_cache: dict[str, tuple[int, str]] = {}
+        self._event_bus.subscribe_all(self._on_event)
 
         self._deps = ServiceDeps(
             event_bus=self._event_bus,
@@ -110,27 +119,66 @@ class RemoraService:
         )
 
     def index_html(self) -> str:
-        state = self._projector.snapshot()
-        return render_shell(render_dashboard(state, bundle_default=self._bundle_default))
+        return render_shell(self._render_dashboard())
 
     @property
     def event_bus(self) -> EventBus:
         return self._event_bus
 
     async def subscribe_stream(self) -> AsyncIterator[str]:
-        yield render_patch(self._projector.snapshot(), bundle_default=self._bundle_default)
-        async with self._event_bus.stream() as events:
-            async for _event in events:
-                yield render_patch(self._projector.snapshot(), bundle_default=self._bundle_default)
-
-    async def events_stream(self) -> AsyncIterator[str]:
-        yield ": open\n\n"
-        async with self._event_bus.stream() as events:
-            async for event in events:
-                envelope = normalize_event(event)
-                data = json.dumps(envelope, default=str)
-                event_name = envelope.get("type", "event")
-                yield f"event: {event_name}\ndata: {data}\n\n"
+        seen = dict(self._projector.versions)
+        yield render_elements_patch(self._render_dashboard())
+        # The patch queue only carries wake-ups: what changed is read from the projector.
+        async with _client_queue(self._patch_queues, maxsize=1) as queue:
+            while True:
+                await queue.get()
+                # Let a burst of events settle so it is rendered as one frame.
+                await asyncio.sleep(PATCH_DEBOUNCE_SECONDS)
+                _drain(queue)
+                changed = self._projector.changed_panels(seen)
+                if not changed:
+                    continue
+                yield self._render_panel_patches(changed)
+
+    async def events_stream(self) -> AsyncIterator[bytes]:
+        yield b": open\n\n"
+        async with _client_queue(self._event_queues) as queue:
+            while True:
+                frames = [await queue.get()]
+                # Flush everything that queued up meanwhile as one chunk.
+                while not queue.empty():
+                    frames.append(queue.get_nowait())
+                yield b"".join(frames)
+
+    def _render_dashboard(self) -> str:
+        """Render the full dashboard, reusing the last render while the projector is unchanged."""
+        version = self._projector.version
+        if self._dashboard_cache is None or self._dashboard_cache[0] != version:
+            html = render_dashboard(self._projector.snapshot(), bundle_default=self._bundle_default)
+            self._dashboard_cache = (version, html)
+        return self._dashboard_cache[1]
+
+    def _render_panel_patches(self, panels: list[str]) -> str:
+        """Render patches for ``panels``, sharing each panel's render across clients per version."""
+        versions = self._projector.versions
+        stale = [panel for panel in panels if self._panel_cache.get(panel, (None,))[0] != versions[panel]]
+        if stale:
+            state = self._projector.panel_snapshot(stale)
+            for panel in stale:
+                patch = render_panel_patches(state, (panel,), bundle_default=self._bundle_default)
+                self._panel_cache[panel] = (versions[panel], patch)
+        return "".join(self._panel_cache[panel][1] for panel in panels)
+
+    def _on_event(self, event: Any) -> None:
+        envelope = normalize_event(event)
+        self._projector.record(event, envelope)
+        for queue in self._patch_queues:
+            if not queue.full():
+                queue.put_nowait(None)
+        if self._event_queues:
+            frame = _format_event_frame(envelope)
+            for queue in self._event_queues:
+                _put_latest(queue, frame)
 
     async def replay_events(
         self,
@@ -164,9 +212,6 @@ class RemoraService:
     def get_swarm_state(self) -> SwarmState | None:
         return self._swarm_state
 
-    def get_subscriptions(self) -> SubscriptionRegistry | None:
-        return self._subscriptions
-        
     def get_workspace_service(self) -> CairnWorkspaceService | None:
         return self._workspace_service
 
@@ -188,6 +233,44 @@ class RemoraService:
         return await handle_swarm_get_subscriptions(agent_id, self._deps)
 
 
+@asynccontextmanager
+async def _client_queue(
+    queues: set[asyncio.Queue[Any]],
+    *,
+    maxsize: int = CLIENT_QUEUE_SIZE,
+) -> AsyncIterator[asyncio.Queue[Any]]:
+    """Register a bounded per-client queue fed by the service's shared bus subscription.
+
+    Slow clients drop their oldest pending items instead of growing without bound.
+    """
+    queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=maxsize)
+    queues.add(queue)
+    try:
+        yield queue
+    finally:
+        queues.discard(queue)
+
+
+def _put_latest(queue: asyncio.Queue[Any], item: Any) -> None:
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(item)
+
+
+def _drain(queue: asyncio.Queue[Any]) -> None:
+    while not queue.empty():
+        queue.get_nowait()
+
+
+def _format_event_frame(envelope: dict[str, Any]) -> bytes:
+    return b"".join((_frame_prefix(envelope.get("type", "event")), json_dumpb(envelope), b"\n\n"))
+
+
+@lru_cache(maxsize=128)
+def _frame_prefix(event_name: str) -> bytes:
+    return f"event: {event_name}\ndata: ".encode()
+
+
 def _resolve_bundle_default(config: Config) -> str:
     snapshot = ConfigSnapshot.from_config(config)
     mapping = snapshot.bundles.get("mapping", {})
@@ -11,10 +11,10 @@ from remora.core.config import Config
 from remora.core.discovery import discover
 from remora.core.event_bus import EventBus
 from remora.core.event_store import EventStore
-from remora.core.events import HumanInputResponseEvent
+from remora.core.events import AgentMessageEvent, ContentChangedEvent, HumanInputResponseEvent
 from remora.models import ConfigSnapshot, InputResponse
 from remora.ui.projector import UiStateProjector
-from remora.utils import PathResolver
+from remora.utils import PathResolver, to_project_relative
 
 if TYPE_CHECKING:
     from remora.core.subscriptions import SubscriptionRegistry
@@ -71,8 +71,6 @@ async def handle_swarm_emit(request: Any, deps: ServiceDeps) -> dict[str, Any]:
     if deps.event_store is None:
         raise ValueError("event store not configured")
 
-    from remora.core.events import AgentMessageEvent, ContentChangedEvent
-
     event_type = getattr(request, "event_type", None)
     data = getattr(request, "data", {}) or {}
 
@@ -84,8 +82,6 @@ async def handle_swarm_emit(request: Any, deps: ServiceDeps) -> dict[str, Any]:
             tags=data.get("tags", []),
         )
     elif event_type == "ContentChangedEvent":
-        from remora.utils import to_project_relative
-
         path = to_project_relative(deps.project_root, data.get("path", ""))
         event = ContentChangedEvent(path=path, diff=data.get("diff"))
     else:
@@ -118,20 +114,7 @@ async def handle_swarm_get_subscriptions(agent_id: str, deps: ServiceDeps) -> li
     if deps.subscriptions is None:
         raise ValueError("subscriptions not configured")
     subs = await deps.subscriptions.get_subscriptions(agent_id)
-    return [
-        {
-            "id": sub.id,
-            "pattern": {
-                "event_types": sub.pattern.event_types,
-                "from_agents": sub.pattern.from_agents,
-                "to_agent": sub.pattern.to_agent,
-                "path_glob": sub.pattern.path_glob,
-                "tags": sub.pattern.tags,
-            },
-            "is_default": sub.is_default,
-        }
-        for sub in subs
-    ]
+    return [sub.to_dict() for sub in subs]
 
 
 __all__ = [
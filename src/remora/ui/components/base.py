@@ -5,6 +5,9 @@ from __future__ import annotations
 import html
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from functools import lru_cache
+
+_escape = html.escape
 
 
 class Component(ABC):
@@ -64,33 +67,32 @@ class Element(Component):
     self_closing: bool = False
 
     def render(self) -> str:
+        tag = self.tag
         attr_parts: list[str] = []
 
         if self.id:
-            attr_parts.append(f'id="{html.escape(self.id)}"')
+            attr_parts.append(f'id="{_escape(self.id)}"')
 
         if self.class_:
-            attr_parts.append(f'class="{html.escape(self.class_)}"')
+            attr_parts.append(f'class="{_escape(self.class_)}"')
 
-        for key, value in self.attrs.items():
-            if value is not None:
-                safe_key = _normalize_attr_key(key)
-                attr_parts.append(f'{safe_key}="{html.escape(str(value))}"')
+        if self.attrs:
+            for key, value in self.attrs.items():
+                if value is not None:
+                    attr_parts.append(f'{_normalize_attr_key(key)}="{_escape(str(value))}"')
 
-        for key, value in self.data_attrs.items():
-            safe_key = _normalize_attr_key(key)
-            attr_parts.append(f'data-{safe_key}="{html.escape(str(value))}"')
+        if self.data_attrs:
+            for key, value in self.data_attrs.items():
+                attr_parts.append(f'data-{_normalize_attr_key(key)}="{_escape(str(value))}"')
 
-        attr_str = " ".join(attr_parts)
+        open_tag = f"<{tag} {' '.join(attr_parts)}" if attr_parts else f"<{tag}"
 
         if self.self_closing:
-            return f"<{self.tag} {attr_str}/>" if attr_str else f"<{self.tag}/>"
-
-        content = self.content.render() if isinstance(self.content, Component) else html.escape(str(self.content))
+            return f"{open_tag}/>"
 
-        if attr_str:
-            return f"<{self.tag} {attr_str}>{content}</{self.tag}>"
-        return f"<{self.tag}>{content}</{self.tag}>"
+        content = self.content
+        content = content.render() if isinstance(content, Component) else _escape(str(content))
+        return f"{open_tag}>{content}</{tag}>"
 
 
 def escape(text: str) -> str:
@@ -98,6 +100,7 @@ def escape(text: str) -> str:
     return html.escape(text)
 
 
+@lru_cache(maxsize=256)
 def _normalize_attr_key(key: str) -> str:
     placeholder = "\0"
     key = key.replace("__", placeholder)
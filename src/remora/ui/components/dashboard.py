@@ -5,13 +5,22 @@ from __future__ import annotations
 import html
 import json
 import time
+from collections.abc import Sequence
 from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import islice
 from typing import Any
 
 from remora.ui.components.base import Component, Element, RawHTML
-from remora.ui.components.data import List, ListItem, ProgressBar, StatusBadge
+from remora.ui.components.data import List
 from remora.ui.components.layout import Card
 
+_EVENT_OPEN = '<div class="event"><span class="event-time">'
+_EVENT_TYPE_OPEN = '</span><span class="event-type">'
+_EVENT_AGENT_OPEN = '</span><span class="event-agent">@'
+_SPAN_CLOSE = "</span>"
+_DIV_CLOSE = "</div>"
+
 
 @dataclass
 class EventItem(Component):
@@ -20,41 +29,48 @@ class EventItem(Component):
     event: dict[str, Any]
 
     def render(self) -> str:
-        timestamp = self.event.get("timestamp", 0)
-        if timestamp:
-            timestamp_str = time.strftime("%H:%M:%S", time.localtime(timestamp))
-        else:
-            timestamp_str = "--:--:--"
+        buf: list[str] = []
+        self.render_into(buf)
+        return "".join(buf)
 
-        event_type = self.event.get("type", "")
-        agent_id = self.event.get("agent_id", "")
+    def render_into(self, buf: list[str]) -> None:
+        """Append this item's HTML fragments to ``buf``."""
         kind = self.event.get("kind", "")
         if hasattr(kind, "value"):
             kind = getattr(kind, "value")
-        label = f"{kind}:{event_type}" if kind else event_type
+        buf.append(
+            _render_event_item(
+                self.event.get("timestamp", 0),
+                str(kind),
+                str(self.event.get("type", "")),
+                str(self.event.get("agent_id", "") or ""),
+            )
+        )
 
-        parts = [
-            Element(tag="span", content=timestamp_str, class_="event-time").render(),
-            Element(tag="span", content=label, class_="event-type").render(),
-        ]
 
-        if agent_id:
-            parts.append(
-                Element(tag="span", content=f"@{agent_id}", class_="event-agent").render()
-            )
+@lru_cache(maxsize=512)
+def _render_event_item(timestamp: float, kind: str, event_type: str, agent_id: str) -> str:
+    # The same recent events are re-rendered on every events-panel patch; format each one once.
+    if timestamp:
+        timestamp_str = time.strftime("%H:%M:%S", time.localtime(timestamp))
+    else:
+        timestamp_str = "--:--:--"
+    label = f"{kind}:{event_type}" if kind else event_type
 
-        return Element(
-            tag="div",
-            content=RawHTML("".join(parts)),
-            class_="event",
-        ).render()
+    parts = [_EVENT_OPEN, timestamp_str, _EVENT_TYPE_OPEN, html.escape(label)]
+    if agent_id:
+        parts.append(_EVENT_AGENT_OPEN)
+        parts.append(html.escape(agent_id))
+    parts.append(_SPAN_CLOSE)
+    parts.append(_DIV_CLOSE)
+    return "".join(parts)
 
 
 @dataclass
 class EventsList(Component):
     """List of recent events."""
 
-    events: list[dict[str, Any]] = field(default_factory=list)
+    events: Sequence[dict[str, Any]] = field(default_factory=list)
     max_display: int = 50
 
     def render(self) -> str:
@@ -65,12 +81,16 @@ class EventsList(Component):
                 empty_message="No events yet",
             ).render()
 
-        items = [EventItem(event) for event in reversed(self.events[-self.max_display :])]
-        return List(
-            items=items,
-            id="events-list",
-            class_="events-list",
-        ).render()
+        buf = ['<div id="events-list" class="events-list">']
+        for event in islice(reversed(self.events), self.max_display):
+            EventItem(event).render_into(buf)
+        buf.append(_DIV_CLOSE)
+        return "".join(buf)
+
+
+_AGENT_ITEM_OPEN = '<div class="agent-item"><span class="state-indicator '
+_AGENT_NAME_OPEN = '"></span><span class="agent-name">'
+_AGENT_ITEM_CLOSE = "</span></div>"
 
 
 @dataclass
@@ -81,21 +101,20 @@ class AgentStatusItem(Component):
     state_info: dict[str, Any]
 
     def render(self) -> str:
+        buf: list[str] = []
+        self.render_into(buf)
+        return "".join(buf)
+
+    def render_into(self, buf: list[str]) -> None:
+        """Append this item's HTML fragments to ``buf``."""
         state = self.state_info.get("state", "pending")
         name = self.state_info.get("name", self.agent_id)
 
-        badge = StatusBadge(status=state).render()
-        name_el = Element(
-            tag="span",
-            content=name,
-            class_="agent-name",
-        ).render()
-
-        return Element(
-            tag="div",
-            content=RawHTML(badge + name_el),
-            class_="agent-item",
-        ).render()
+        buf.append(_AGENT_ITEM_OPEN)
+        buf.append(html.escape(str(state)))
+        buf.append(_AGENT_NAME_OPEN)
+        buf.append(html.escape(str(name)))
+        buf.append(_AGENT_ITEM_CLOSE)
 
 
 @dataclass
@@ -112,15 +131,11 @@ class AgentStatusList(Component):
                 empty_message="No agents started yet",
             ).render()
 
-        items = [
-            AgentStatusItem(agent_id, info)
-            for agent_id, info in self.agent_states.items()
-        ]
-        return List(
-            items=items,
-            id="agent-status",
-            class_="agent-status",
-        ).render()
+        buf = ['<div id="agent-status" class="agent-status">']
+        for agent_id, info in self.agent_states.items():
+            AgentStatusItem(agent_id, info).render_into(buf)
+        buf.append(_DIV_CLOSE)
+        return "".join(buf)
 
 
 @dataclass
@@ -200,6 +215,72 @@ class BlockedAgentCard(Component):
         ).render()
 
 
+def _render_launcher_form() -> str:
+    target_input = Element(
+        tag="input",
+        attrs={
+            "placeholder": "Target path (file or directory)",
+            "type": "text",
+            "id": "target-path",
+            "autocomplete": "off",
+        },
+        data_attrs={"bind": "graphLauncher.target_path"},
+        self_closing=True,
+    ).render()
+
+    bundle_input = Element(
+        tag="input",
+        attrs={
+            "placeholder": "Bundle name (e.g., lint, docstring)",
+            "type": "text",
+        },
+        data_attrs={"bind": "graphLauncher.bundle"},
+        self_closing=True,
+    ).render()
+
+    run_button = Element(
+        tag="button",
+        content="Run Graph",
+        attrs={"type": "button"},
+        data_attrs={
+            "on": "click",
+            "on-click": """
+                const target = $graphLauncher?.target_path?.trim();
+                const bundle = $graphLauncher?.bundle?.trim() || 'lint';
+                if (!target) {
+                    alert('Target path is required.');
+                    return;
+                }
+                @post('/run', {target_path: target, bundle: bundle});
+            """,
+        },
+    ).render()
+
+    root_button = Element(
+        tag="button",
+        content="Run Root Graph",
+        attrs={"type": "button"},
+        data_attrs={
+            "on": "click",
+            "on-click": """
+                const bundle = $graphLauncher?.bundle?.trim() || 'lint';
+                @post('/run', {target_path: '.', bundle: bundle});
+            """,
+        },
+    ).render()
+
+    return Element(
+        tag="div",
+        content=RawHTML(target_input + bundle_input + run_button + root_button),
+        class_="graph-launcher-form",
+    ).render()
+
+
+# The launcher form is identical on every render; only the signals and recent targets vary.
+_LAUNCHER_FORM = _render_launcher_form()
+_RECENT_LABEL = Element(tag="div", content="Recent targets", class_="recent-label").render()
+
+
 @dataclass
 class GraphLauncher(Component):
     """Graph launcher form."""
@@ -208,107 +289,20 @@ class GraphLauncher(Component):
     bundle_default: str = ""
 
     def render(self) -> str:
-        defaults = {
-            "graphLauncher": {
-                "target_path": "",
-                "bundle": self.bundle_default or "",
-            }
-        }
-        signals_attr = html.escape(json.dumps(defaults), quote=True)
-
-        target_input = Element(
-            tag="input",
-            attrs={
-                "placeholder": "Target path (file or directory)",
-                "type": "text",
-                "id": "target-path",
-                "autocomplete": "off",
-            },
-            data_attrs={"bind": "graphLauncher.target_path"},
-            self_closing=True,
-        ).render()
-
-        bundle_input = Element(
-            tag="input",
-            attrs={
-                "placeholder": "Bundle name (e.g., lint, docstring)",
-                "type": "text",
-            },
-            data_attrs={"bind": "graphLauncher.bundle"},
-            self_closing=True,
-        ).render()
-
-        run_button = Element(
-            tag="button",
-            content="Run Graph",
-            attrs={"type": "button"},
-            data_attrs={
-                "on": "click",
-                "on-click": """
-                    const target = $graphLauncher?.target_path?.trim();
-                    const bundle = $graphLauncher?.bundle?.trim() || 'lint';
-                    if (!target) {
-                        alert('Target path is required.');
-                        return;
-                    }
-                    @post('/run', {target_path: target, bundle: bundle});
-                """,
-            },
-        ).render()
-
-        root_button = Element(
-            tag="button",
-            content="Run Root Graph",
-            attrs={"type": "button"},
-            data_attrs={
-                "on": "click",
-                "on-click": """
-                    const bundle = $graphLauncher?.bundle?.trim() || 'lint';
-                    @post('/run', {target_path: '.', bundle: bundle});
-                """,
-            },
-        ).render()
-
-        form = Element(
-            tag="div",
-            content=RawHTML(target_input + bundle_input + run_button + root_button),
-            class_="graph-launcher-form",
-        ).render()
-
-        signals_div = Element(
-            tag="div",
-            content="",
-            attrs={"style": "display:none"},
-            data_attrs={"signals__ifmissing": signals_attr},
-        ).render()
+        signals_div = _launcher_signals(self.bundle_default or "")
 
         recent_panel = ""
         if self.recent_targets:
-            recent_buttons = "".join(
-                Element(
-                    tag="button",
-                    content=target,
-                    attrs={"type": "button"},
-                    class_="recent-target",
-                    data_attrs={
-                        "on": "click",
-                        "on-click": f"$graphLauncher.target_path = '{self._escape_js(target)}';",
-                    },
-                ).render()
-                for target in self.recent_targets
-            )
+            recent_buttons = "".join(_recent_target_button(target) for target in self.recent_targets)
             recent_panel = Element(
                 tag="div",
-                content=RawHTML(
-                    Element(tag="div", content="Recent targets", class_="recent-label").render()
-                    + recent_buttons
-                ),
+                content=RawHTML(_RECENT_LABEL + recent_buttons),
                 class_="recent-targets",
             ).render()
 
         return Card(
             title="Run Agent Graph",
-            content=RawHTML(form + recent_panel + signals_div),
+            content=RawHTML(_LAUNCHER_FORM + recent_panel + signals_div),
             class_="card graph-launcher-card",
         ).render()
 
@@ -317,11 +311,47 @@ class GraphLauncher(Component):
         return value.replace("\\", "\\\\").replace("'", "\\'").replace("\n", "\\n")
 
 
+@lru_cache(maxsize=8)
+def _launcher_signals(bundle_default: str) -> str:
+    defaults = {
+        "graphLauncher": {
+            "target_path": "",
+            "bundle": bundle_default,
+        }
+    }
+    signals_attr = html.escape(json.dumps(defaults), quote=True)
+    return Element(
+        tag="div",
+        content="",
+        attrs={"style": "display:none"},
+        data_attrs={"signals__ifmissing": signals_attr},
+    ).render()
+
+
+@lru_cache(maxsize=64)
+def _recent_target_button(target: str) -> str:
+    return Element(
+        tag="button",
+        content=target,
+        attrs={"type": "button"},
+        class_="recent-target",
+        data_attrs={
+            "on": "click",
+            "on-click": f"$graphLauncher.target_path = '{GraphLauncher._escape_js(target)}';",
+        },
+    ).render()
+
+
+_RESULT_OPEN = '<div class="result-item"><div class="result-agent">'
+_RESULT_CONTENT_OPEN = '</div><div class="result-content">'
+_RESULT_CLOSE = "</div></div>"
+
+
 @dataclass
 class ResultsList(Component):
     """List of agent results."""
 
-    results: list[dict[str, Any]] = field(default_factory=list)
+    results: Sequence[dict[str, Any]] = field(default_factory=list)
     max_display: int = 10
 
     def render(self) -> str:
@@ -332,30 +362,15 @@ class ResultsList(Component):
                 empty_message="No results yet",
             ).render()
 
-        items: list[ListItem] = []
-        for result in self.results[: self.max_display]:
-            agent_el = Element(
-                tag="div",
-                content=result.get("agent_id", ""),
-                class_="result-agent",
-            ).render()
-            content_el = Element(
-                tag="div",
-                content=result.get("content", ""),
-                class_="result-content",
-            ).render()
-            items.append(
-                ListItem(
-                    content=RawHTML(agent_el + content_el),
-                    class_="result-item",
-                )
-            )
-
-        return List(
-            items=items,
-            id="results-list",
-            class_="results",
-        ).render()
+        buf = ['<div id="results-list" class="results">']
+        for result in islice(self.results, self.max_display):
+            buf.append(_RESULT_OPEN)
+            buf.append(html.escape(str(result.get("agent_id", ""))))
+            buf.append(_RESULT_CONTENT_OPEN)
+            buf.append(html.escape(str(result.get("content", ""))))
+            buf.append(_RESULT_CLOSE)
+        buf.append(_DIV_CLOSE)
+        return "".join(buf)
 
 
 __all__ = [
@@ -4,12 +4,15 @@ from __future__ import annotations
 
 import time
 from collections import deque
-from dataclasses import asdict, dataclass, field, is_dataclass
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass, field, fields, is_dataclass
 from enum import Enum
+from itertools import islice
 from typing import Any
 
 from structured_agents.events import Event as StructuredEvent
 
+from remora.core.event_bus import emit_cached
 from remora.core.events import (
     AgentCompleteEvent,
     AgentErrorEvent,
@@ -25,8 +28,12 @@ from remora.core.events import (
     ToolResultEvent,
     TurnCompleteEvent,
 )
+from remora.utils import PLAIN_TYPES, field_reader
 
 MAX_EVENTS = 200
+MAX_RESULTS = 50
+
+PANELS: tuple[str, ...] = ("events", "blocked", "agents", "results", "progress", "targets")
 
 
 class EventKind(str, Enum):
@@ -57,32 +64,84 @@ def _to_jsonable(value: Any) -> Any:
 
 
 def normalize_event(event: StructuredEvent | RemoraEvent) -> dict[str, Any]:
-    """Wrap an event in a UI-friendly envelope."""
-    kind = _event_kind(event)
-    timestamp = getattr(event, "timestamp", None) or time.time()
-    payload = _event_payload(event)
+    """Wrap an event in a UI-friendly envelope.
+
+    Within one ``EventBus.emit`` the envelope is built once and shared between the
+    subscribers that ask for it, so treat the result as read-only.
+    """
+    return emit_cached(event, normalize_event, _build_envelope)
+
+
+def _build_envelope(event: StructuredEvent | RemoraEvent) -> dict[str, Any]:
+    event_cls = type(event)
+    builder = _ENVELOPE_BUILDERS.get(event_cls)
+    if builder is None:
+        builder = _ENVELOPE_BUILDERS[event_cls] = _make_envelope_builder(event_cls)
+    return builder(event)
+
+
+EnvelopeBuilder = Callable[[Any], dict[str, Any]]
+
+_ENVELOPE_BUILDERS: dict[type, EnvelopeBuilder] = {}
+
+
+def _make_envelope_builder(event_cls: type) -> EnvelopeBuilder:
+    """Precompute the per-class parts of ``normalize_event``.
+
+    Kind, type name and field layout are fixed per event class, so they are resolved once
+    and each event only pays for reading its own field values.
+    """
+    kind = _event_kind(event_cls)
+    type_name = event_cls.__name__
+    if not is_dataclass(event_cls):
+        return lambda event: _generic_envelope(event, kind, type_name)
+
+    names = tuple(f.name for f in fields(event_cls))
+    read_fields = field_reader(names)
+    has_timestamp = "timestamp" in names
+    has_graph_id = "graph_id" in names
+    has_agent_id = "agent_id" in names
+
+    def build(event: Any) -> dict[str, Any]:
+        payload = {
+            name: value if type(value) in PLAIN_TYPES else _to_jsonable(value)
+            for name, value in zip(names, read_fields(event), strict=True)
+        }
+        return {
+            "kind": kind,
+            "type": type_name,
+            "graph_id": event.graph_id if has_graph_id else "",
+            "agent_id": event.agent_id if has_agent_id else "",
+            "timestamp": (event.timestamp if has_timestamp else None) or time.time(),
+            "payload": payload,
+        }
+
+    return build
+
+
+def _generic_envelope(event: Any, kind: EventKind, type_name: str) -> dict[str, Any]:
     return {
         "kind": kind,
-        "type": type(event).__name__,
+        "type": type_name,
         "graph_id": getattr(event, "graph_id", ""),
         "agent_id": getattr(event, "agent_id", ""),
-        "timestamp": timestamp,
-        "payload": payload,
+        "timestamp": getattr(event, "timestamp", None) or time.time(),
+        "payload": _event_payload(event),
     }
 
 
-def _event_kind(event: StructuredEvent | RemoraEvent) -> EventKind:
-    if isinstance(event, (AgentStartEvent, AgentCompleteEvent, AgentErrorEvent)):
+def _event_kind(event_cls: type) -> EventKind:
+    if issubclass(event_cls, (AgentStartEvent, AgentCompleteEvent, AgentErrorEvent)):
         return EventKind.AGENT
-    if isinstance(event, (HumanInputRequestEvent, HumanInputResponseEvent)):
+    if issubclass(event_cls, (HumanInputRequestEvent, HumanInputResponseEvent)):
         return EventKind.HUMAN
-    if isinstance(event, (ToolCallEvent, ToolResultEvent)):
+    if issubclass(event_cls, (ToolCallEvent, ToolResultEvent)):
         return EventKind.TOOL
-    if isinstance(event, (ModelRequestEvent, ModelResponseEvent)):
+    if issubclass(event_cls, (ModelRequestEvent, ModelResponseEvent)):
         return EventKind.MODEL
-    if isinstance(event, (KernelStartEvent, KernelEndEvent)):
+    if issubclass(event_cls, (KernelStartEvent, KernelEndEvent)):
         return EventKind.KERNEL
-    if isinstance(event, TurnCompleteEvent):
+    if issubclass(event_cls, TurnCompleteEvent):
         return EventKind.TURN
     return EventKind.EVENT
 
@@ -104,11 +163,26 @@ class UiStateProjector:
     events: deque[dict[str, Any]] = field(default_factory=lambda: deque(maxlen=MAX_EVENTS))
     blocked: dict[str, dict[str, Any]] = field(default_factory=dict)
     agent_states: dict[str, dict[str, Any]] = field(default_factory=dict)
-    results: list[dict[str, Any]] = field(default_factory=list)
+    results: deque[dict[str, Any]] = field(default_factory=lambda: deque(maxlen=MAX_RESULTS))
     total_agents: int = 0
     completed_agents: int = 0
     failed_agents: int = 0
     recent_targets: deque[str] = field(default_factory=lambda: deque(maxlen=10))
+    versions: dict[str, int] = field(default_factory=lambda: dict.fromkeys(PANELS, 0))
+    version: int = 0
+    _snapshot_cache: tuple[int, dict[str, Any]] | None = field(default=None, repr=False, compare=False)
+
+    def changed_panels(self, seen: dict[str, int]) -> list[str]:
+        """Return panels updated since ``seen`` and advance ``seen`` in place."""
+        changed = [panel for panel, version in self.versions.items() if seen.get(panel) != version]
+        for panel in changed:
+            seen[panel] = self.versions[panel]
+        return changed
+
+    def _touch(self, *panels: str) -> None:
+        self.version += 1
+        for panel in panels:
+            self.versions[panel] += 1
 
     def record_target(self, target_path: str) -> None:
         cleaned = target_path.strip()
@@ -119,18 +193,27 @@ class UiStateProjector:
         except ValueError:
             pass
         self.recent_targets.appendleft(cleaned)
+        self._touch("targets")
+
+    def record(self, event: StructuredEvent | RemoraEvent, envelope: dict[str, Any] | None = None) -> None:
+        """Apply ``event`` to the UI state.
 
-    def record(self, event: StructuredEvent | RemoraEvent) -> None:
-        envelope = normalize_event(event)
+        Callers that already normalized the event can pass ``envelope`` to avoid doing it twice.
+        """
+        if envelope is None:
+            envelope = normalize_event(event)
         self.events.append(envelope)
+        self._touch("events")
 
         if isinstance(event, AgentStartEvent):
             self.agent_states[event.agent_id] = {
                 "state": "started",
                 "name": event.node_name or event.agent_id,
             }
+            self._touch("agents")
             if self.total_agents == 0:
                 self.total_agents += 1
+                self._touch("progress")
 
         elif isinstance(event, HumanInputRequestEvent):
             self.blocked[event.request_id] = {
@@ -139,11 +222,14 @@ class UiStateProjector:
                 "options": list(event.options) if event.options else [],
                 "request_id": event.request_id,
             }
+            self._touch("blocked")
 
         elif isinstance(event, HumanInputResponseEvent):
-            self.blocked.pop(event.request_id, None)
+            if self.blocked.pop(event.request_id, None) is not None:
+                self._touch("blocked")
 
         elif isinstance(event, (AgentCompleteEvent, AgentErrorEvent)):
+            self._touch("agents", "progress")
             if event.agent_id in self.agent_states:
                 state_map = {
                     AgentCompleteEvent: "completed",
@@ -157,30 +243,48 @@ class UiStateProjector:
                 self.failed_agents += 1
 
         if isinstance(event, AgentCompleteEvent):
-            self.results.insert(
-                0,
+            self.results.appendleft(
                 {
                     "agent_id": event.agent_id,
                     "content": str(event.result_summary),
                     "timestamp": getattr(event, "timestamp", 0),
-                },
+                }
             )
-            if len(self.results) > 50:
-                self.results.pop()
+            self._touch("results")
 
     def snapshot(self) -> dict[str, Any]:
-        return {
-            "events": list(self.events),
-            "blocked": list(self.blocked.values()),
-            "agent_states": self.agent_states,
-            "progress": {
-                "total": self.total_agents,
-                "completed": self.completed_agents,
-                "failed": self.failed_agents,
-            },
-            "results": self.results[:10],
-            "recent_targets": list(self.recent_targets),
-        }
+        """Return the full UI state, shared between callers until the next change.
+
+        Treat the result as read-only.
+        """
+        cached = self._snapshot_cache
+        if cached is not None and cached[0] == self.version:
+            return cached[1]
+        state = self.panel_snapshot(PANELS)
+        self._snapshot_cache = (self.version, state)
+        return state
+
+    def panel_snapshot(self, panels: Iterable[str]) -> dict[str, Any]:
+        """Build only the parts of the snapshot that ``panels`` render from."""
+        state: dict[str, Any] = {}
+        for panel in panels:
+            if panel == "events":
+                state["events"] = list(self.events)
+            elif panel == "blocked":
+                state["blocked"] = list(self.blocked.values())
+            elif panel == "agents":
+                state["agent_states"] = self.agent_states
+            elif panel == "results":
+                state["results"] = list(islice(self.results, 10))
+            elif panel == "progress":
+                state["progress"] = {
+                    "total": self.total_agents,
+                    "completed": self.completed_agents,
+                    "failed": self.failed_agents,
+                }
+            elif panel == "targets":
+                state["recent_targets"] = list(self.recent_targets)
+        return state
 
     def reset(self) -> None:
         self.events.clear()
@@ -191,6 +295,7 @@ class UiStateProjector:
         self.completed_agents = 0
         self.failed_agents = 0
         self.recent_targets.clear()
+        self._touch(*PANELS)
 
 
-__all__ = ["EventKind", "UiStateProjector", "normalize_event"]
+__all__ = ["EventKind", "PANELS", "UiStateProjector", "normalize_event"]
@@ -2,24 +2,27 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from typing import Any
 
 from remora.ui.components import (
     AgentStatusList,
+    BlockedAgentCard,
     Card,
     EventsList,
     GraphLauncher,
+    List,
     ProgressBar,
     ResultsList,
 )
 from remora.ui.components.base import Element, RawHTML
 
+_HEADER_TITLE = Element(tag="div", content="Remora Dashboard").render()
+_EVENTS_HEADER = Element(tag="div", content="Events Stream", id="events-header").render()
+
 
 def render_blocked_list(blocked: list[dict[str, Any]]) -> str:
     """Render the blocked agents list."""
-    from remora.ui.components.dashboard import BlockedAgentCard
-    from remora.ui.components.data import List
-
     if not blocked:
         return List(
             id="blocked-agents",
@@ -35,6 +38,82 @@ def render_blocked_list(blocked: list[dict[str, Any]]) -> str:
     ).render()
 
 
+def render_header_status(progress: dict[str, Any]) -> str:
+    """Render the agent counter shown in the dashboard header."""
+    return Element(
+        tag="div",
+        content=f"Agents: {progress['completed']}/{progress['total']}",
+        id="header-status",
+        class_="status",
+    ).render()
+
+
+def render_events_list(events: list[dict[str, Any]]) -> str:
+    """Render the events stream list."""
+    return EventsList(events=events).render()
+
+
+def render_agent_status(agent_states: dict[str, dict[str, Any]]) -> str:
+    """Render the agent status list."""
+    return AgentStatusList(agent_states=agent_states).render()
+
+
+def render_results(results: list[dict[str, Any]]) -> str:
+    """Render the recent results list."""
+    return ResultsList(results=results).render()
+
+
+def render_progress(progress: dict[str, Any]) -> str:
+    """Render the graph execution progress bar."""
+    return Element(
+        tag="div",
+        content=ProgressBar(
+            total=progress["total"],
+            completed=progress["completed"],
+            failed=progress.get("failed", 0),
+        ),
+        id="graph-progress",
+    ).render()
+
+
+def render_launcher(recent_targets: list[str], *, bundle_default: str = "") -> str:
+    """Render the graph launcher card."""
+    return Element(
+        tag="div",
+        content=GraphLauncher(recent_targets=recent_targets, bundle_default=bundle_default),
+        id="graph-launcher",
+    ).render()
+
+
+def render_panel_fragments(
+    state: dict[str, Any],
+    panels: Iterable[str],
+    *,
+    bundle_default: str = "",
+) -> list[str]:
+    """Render only the dashboard fragments for ``panels``.
+
+    Each fragment's root element carries a stable id so it can be patched in place.
+    """
+    progress = state.get("progress", {"total": 0, "completed": 0, "failed": 0})
+    fragments: list[str] = []
+    for panel in panels:
+        if panel == "events":
+            fragments.append(render_events_list(state.get("events", [])))
+        elif panel == "blocked":
+            fragments.append(render_blocked_list(state.get("blocked", [])))
+        elif panel == "agents":
+            fragments.append(render_agent_status(state.get("agent_states", {})))
+        elif panel == "results":
+            fragments.append(render_results(state.get("results", [])))
+        elif panel == "progress":
+            fragments.append(render_header_status(progress))
+            fragments.append(render_progress(progress))
+        elif panel == "targets":
+            fragments.append(render_launcher(state.get("recent_targets", []), bundle_default=bundle_default))
+    return fragments
+
+
 def render_dashboard(state: dict[str, Any], *, bundle_default: str = "") -> str:
     """Render the full dashboard using components."""
     events = state.get("events", [])
@@ -47,12 +126,7 @@ def render_dashboard(state: dict[str, Any], *, bundle_default: str = "") -> str:
     header = Element(
         tag="div",
         content=RawHTML(
-            Element(tag="div", content="Remora Dashboard").render()
-            + Element(
-                tag="div",
-                content=f"Agents: {progress['completed']}/{progress['total']}",
-                class_="status",
-            ).render()
+            _HEADER_TITLE + render_header_status(progress)
         ),
         class_="header",
     ).render()
@@ -60,16 +134,12 @@ def render_dashboard(state: dict[str, Any], *, bundle_default: str = "") -> str:
     events_panel = Element(
         tag="div",
         content=RawHTML(
-            Element(tag="div", content="Events Stream", id="events-header").render()
-            + EventsList(events=events).render()
+            _EVENTS_HEADER + render_events_list(events)
         ),
         id="events-panel",
     ).render()
 
-    graph_launcher_card = GraphLauncher(
-        recent_targets=recent_targets,
-        bundle_default=bundle_default,
-    ).render()
+    graph_launcher_card = render_launcher(recent_targets, bundle_default=bundle_default)
 
     blocked_card = Card(
         title="Blocked Agents",
@@ -78,21 +148,17 @@ def render_dashboard(state: dict[str, Any], *, bundle_default: str = "") -> str:
 
     status_card = Card(
         title="Agent Status",
-        content=AgentStatusList(agent_states=agent_states),
+        content=RawHTML(render_agent_status(agent_states)),
     ).render()
 
     results_card = Card(
         title="Results",
-        content=ResultsList(results=results),
+        content=RawHTML(render_results(results)),
     ).render()
 
     progress_card = Card(
         title="Graph Execution",
-        content=ProgressBar(
-            total=progress["total"],
-            completed=progress["completed"],
-            failed=progress.get("failed", 0),
-        ),
+        content=RawHTML(render_progress(progress)),
     ).render()
 
     main_panel = Element(
@@ -140,4 +206,4 @@ def render_tag(tag: str, content: str = "", **attrs: Any) -> str:
     ).render()
 
 
-__all__ = ["render_dashboard", "render_tag"]
+__all__ = ["render_dashboard", "render_panel_fragments", "render_tag"]
@@ -1,5 +1,6 @@
 from remora.utils.fs import managed_workspace
 from remora.utils.path_resolver import PathResolver, to_project_relative
+from remora.utils.serialization import PLAIN_TYPES, field_reader, json_dumpb, json_dumps
 from remora.utils.text import summarize, truncate
 from remora.utils.types import PathLike, normalize_path
 
@@ -9,6 +10,10 @@ __all__ = [
     "PathLike",
     "normalize_path",
     "to_project_relative",
+    "PLAIN_TYPES",
+    "field_reader",
+    "json_dumpb",
+    "json_dumps",
     "summarize",
     "truncate",
 ]
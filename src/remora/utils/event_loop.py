@@ -0,0 +1,27 @@
+"""Event loop selection for long-running entry points.
+
+Uses uvloop when it is installed and falls back to the default asyncio loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Coroutine
+from typing import Any
+
+try:
+    import uvloop
+
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+
+def run[T](main: Coroutine[Any, Any, T]) -> T:
+    """Run ``main`` to completion like ``asyncio.run``, on uvloop when available."""
+    if UVLOOP_AVAILABLE:
+        return asyncio.run(main, loop_factory=uvloop.new_event_loop)
+    return asyncio.run(main)
+
+
+__all__ = ["UVLOOP_AVAILABLE", "run"]
@@ -0,0 +1,57 @@
+"""JSON encoding for hot serialization paths.
+
+Uses orjson when it is installed and falls back to the standard library.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from operator import attrgetter
+from typing import Any
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def json_dumps(value: Any, *, default: Callable[[Any], Any] | None = str) -> str:
+    """Encode ``value`` as compact JSON text.
+
+    Unsupported objects are passed to ``default`` (``str`` unless overridden).
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, default=default).decode()
+    return json.dumps(value, default=default, separators=(",", ":"))
+
+
+def json_dumpb(value: Any, *, default: Callable[[Any], Any] | None = str) -> bytes:
+    """Encode ``value`` as compact UTF-8 JSON bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, default=default)
+    return json.dumps(value, default=default, separators=(",", ":")).encode()
+
+
+PLAIN_TYPES = frozenset({str, int, float, bool, type(None)})
+"""Types that JSON encoders take as-is, compared with ``type(value) in PLAIN_TYPES``."""
+
+FieldReader = Callable[[Any], tuple[Any, ...]]
+
+
+def field_reader(names: tuple[str, ...]) -> FieldReader:
+    """Return a callable reading the ``names`` attributes of an object as a tuple.
+
+    Meant to be built once per class and reused for every instance.
+    """
+    if len(names) > 1:
+        return attrgetter(*names)
+    if names:
+        name = names[0]
+        return lambda obj: (getattr(obj, name),)
+    return lambda obj: ()
+
+
+__all__ = ["FieldReader", "ORJSON_AVAILABLE", "PLAIN_TYPES", "field_reader", "json_dumpb", "json_dumps"]
@@ -64,6 +64,26 @@ class TestDiscover:
             expected = source[node.start_byte : node.end_byte]
             assert node.text == expected
 
+    def test_node_text_after_non_ascii_source(self, tmp_path: Path) -> None:
+        sample = tmp_path / "unicode.py"
+        sample.write_text('GREETING = "héllo"\n\n\ndef wave() -> str:\n    return "👋"\n', encoding="utf-8")
+        nodes = discover([sample], languages=["python"])
+        wave = next(n for n in nodes if n.name == "wave")
+        assert wave.text == 'def wave() -> str:\n    return "👋"'
+
+    def test_cache_dir_skips_unchanged_files(self, tmp_path: Path) -> None:
+        sample = tmp_path / "module.py"
+        sample.write_text("def first():\n    pass\n", encoding="utf-8")
+        cache_dir = tmp_path / "cache"
+        nodes = discover([sample], cache_dir=cache_dir)
+        assert any(path.is_file() for path in cache_dir.rglob("*"))
+        assert discover([sample], cache_dir=cache_dir) == nodes
+
+        sample.write_text("def second():\n    pass\n", encoding="utf-8")
+        assert "second" in {n.name for n in discover([sample], cache_dir=cache_dir)}
+        # The edit replaced the file's entry instead of adding another one.
+        assert sum(path.is_file() for path in cache_dir.rglob("*")) == 1
+
     def test_discover_toml_tables(self) -> None:
         nodes = discover([SAMPLE_TOML], languages=["toml"])
         node_types = {n.node_type for n in nodes}
@@ -3,7 +3,7 @@ import asyncio
 import pytest
 from structured_agents.events import ModelResponseEvent, ToolCallEvent, ToolResultEvent
 
-from remora.core.event_bus import EventBus
+from remora.core.event_bus import EventBus, emit_cached
 from remora.core.events import RemoraEvent
 
 
@@ -79,3 +79,93 @@ async def test_wait_for_predicate_matching_event() -> None:
 
     assert result.output_preview == "ok"
     assert result.tool_name == "read_file"
+
+
+@pytest.mark.asyncio
+async def test_stream_drops_oldest_when_full() -> None:
+    bus = EventBus()
+
+    async with bus.stream(ToolCallEvent, maxsize=2) as events:
+        for index in range(3):
+            await bus.emit(ToolCallEvent(turn=index, tool_name="foo", call_id=f"call-{index}", arguments={}))
+
+        received = [await anext(events), await anext(events)]
+
+    assert [event.call_id for event in received] == ["call-1", "call-2"]
+
+
+@pytest.mark.asyncio
+async def test_wait_for_key_matches_attribute_value() -> None:
+    bus = EventBus()
+
+    first = asyncio.create_task(bus.wait_for_key(ToolResultEvent, "call_id", "call-1", timeout=1.0))
+    second = asyncio.create_task(bus.wait_for_key(ToolResultEvent, "call_id", "call-2", timeout=1.0))
+    await asyncio.sleep(0)
+
+    for call_id in ("call-2", "call-1"):
+        await bus.emit(
+            ToolResultEvent(
+                turn=1,
+                tool_name="read_file",
+                call_id=call_id,
+                is_error=False,
+                duration_ms=0,
+                output_preview=call_id,
+            )
+        )
+
+    assert (await first).output_preview == "call-1"
+    assert (await second).output_preview == "call-2"
+
+
+@pytest.mark.asyncio
+async def test_wait_for_key_unsubscribes_after_last_waiter(caplog: pytest.LogCaptureFixture) -> None:
+    bus = EventBus()
+    received: list[ToolCallEvent] = []
+    bus.subscribe(ToolCallEvent, received.append)
+
+    waiter = asyncio.create_task(bus.wait_for_key(ToolCallEvent, "arguments", "never", timeout=0.05))
+    await asyncio.sleep(0)
+    # An unhashable attribute value cannot match a key and must not make the dispatcher fail.
+    await bus.emit(ToolCallEvent(turn=1, tool_name="foo", call_id="foo-1", arguments={}))
+    with pytest.raises(asyncio.TimeoutError):
+        await waiter
+
+    assert "Event handler error" not in caplog.text
+    assert bus._resolve_handlers(ToolCallEvent) == (received.append,)
+    assert len(received) == 1
+
+
+@pytest.mark.asyncio
+async def test_clear_cancels_keyed_waiters() -> None:
+    bus = EventBus()
+
+    waiter = asyncio.create_task(bus.wait_for_key(ToolResultEvent, "call_id", "call-1", timeout=10.0))
+    await asyncio.sleep(0)
+    bus.clear()
+
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+
+@pytest.mark.asyncio
+async def test_emit_cached_is_shared_within_one_emit_only() -> None:
+    bus = EventBus()
+    built: list[object] = []
+    seen: list[object] = []
+
+    def build(event: object) -> object:
+        built.append(event)
+        return object()
+
+    for _ in range(2):
+        bus.subscribe(ToolCallEvent, lambda event: seen.append(emit_cached(event, "key", build)))
+
+    event = ToolCallEvent(turn=1, tool_name="foo", call_id="foo-1", arguments={})
+    await bus.emit(event)
+    await bus.emit(event)
+
+    assert len(built) == 2
+    assert seen[0] is seen[1]
+    assert seen[2] is seen[3]
+    assert seen[0] is not seen[2]
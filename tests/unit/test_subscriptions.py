@@ -41,6 +41,22 @@ async def test_register_defaults(temp_db: Path) -> None:
     await registry.close()
 
 
+@pytest.mark.asyncio
+async def test_register_defaults_many(temp_db: Path) -> None:
+    registry = SubscriptionRegistry(temp_db)
+    await registry.initialize()
+
+    subs = await registry.register_defaults_many([("agent-a", "src/a.py"), ("agent-b", "src/b.py")])
+
+    assert [sub.agent_id for sub in subs] == ["agent-a", "agent-a", "agent-b", "agent-b"]
+    assert len({sub.id for sub in subs}) == 4
+    assert all(sub.is_default for sub in subs)
+    stored = await registry.get_subscriptions("agent-b")
+    assert [sub.id for sub in stored] == [sub.id for sub in subs[2:]]
+
+    await registry.close()
+
+
 @pytest.mark.asyncio
 async def test_get_matching_agents(temp_db: Path) -> None:
     registry = SubscriptionRegistry(temp_db)
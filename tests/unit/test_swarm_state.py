@@ -129,3 +129,60 @@ async def test_update_agent(temp_db: Path) -> None:
     assert agent.start_line == 5
 
     await swarm.close()
+
+
+@pytest.mark.asyncio
+async def test_upsert_many(temp_db: Path) -> None:
+    swarm = SwarmState(temp_db)
+    await swarm.initialize()
+
+    await swarm.upsert_many([
+        AgentMetadata(
+            agent_id=f"agent-{i}",
+            node_type="function",
+            name=f"agent-{i}",
+            full_name=f"src.a.agent-{i}",
+            file_path="src/a.py",
+            parent_id=None,
+            start_line=i,
+            end_line=i + 1,
+        )
+        for i in range(3)
+    ])
+
+    agents = await swarm.list_agents(status="active")
+    assert sorted(agent.agent_id for agent in agents) == ["agent-0", "agent-1", "agent-2"]
+
+    await swarm.close()
+
+
+@pytest.mark.asyncio
+async def test_get_agents_reports_orphaned(temp_db: Path) -> None:
+    swarm = SwarmState(temp_db)
+    await swarm.initialize()
+
+    await swarm.upsert_many([
+        AgentMetadata(
+            agent_id=f"agent-{i}",
+            node_type="function",
+            name=f"agent-{i}",
+            full_name=f"src.a.agent-{i}",
+            file_path="src/a.py",
+            parent_id=None,
+            start_line=i,
+            end_line=i + 1,
+        )
+        for i in range(3)
+    ])
+    cached_ids = {"agent-0", "agent-1"}
+
+    agents = await swarm.get_agents(cached_ids | {"missing"})
+    assert {agent.agent_id for agent in agents if agent.status == "active"} == cached_ids
+
+    # An orphaned agent drops out of the active set, invalidating a cache entry built on it.
+    await swarm.mark_orphaned("agent-1")
+    agents = await swarm.get_agents(cached_ids)
+    assert {agent.agent_id for agent in agents if agent.status == "active"} == {"agent-0"}
+    assert await swarm.get_agents([]) == []
+
+    await swarm.close()
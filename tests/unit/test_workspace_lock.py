@@ -0,0 +1,57 @@
+"""Tests for AsyncReadWriteLock."""
+
+import asyncio
+
+import pytest
+
+from remora.core.workspace import AsyncReadWriteLock
+
+
+@pytest.mark.asyncio
+async def test_cancelled_reader_releases_lock_for_waiting_writer() -> None:
+    lock = AsyncReadWriteLock()
+    reading = asyncio.Event()
+
+    async def reader() -> None:
+        async with lock.reading():
+            reading.set()
+            await asyncio.Event().wait()
+
+    async def writer() -> None:
+        async with lock.writing():
+            pass
+
+    reader_task = asyncio.create_task(reader())
+    await reading.wait()
+    writer_task = asyncio.create_task(writer())
+    await asyncio.sleep(0)
+
+    reader_task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await reader_task
+
+    await asyncio.wait_for(writer_task, timeout=1.0)
+    async with lock.writing():
+        pass
+
+
+@pytest.mark.asyncio
+async def test_cancelled_writer_unblocks_queued_readers() -> None:
+    lock = AsyncReadWriteLock()
+    await lock.read_acquire()
+
+    writer_task = asyncio.create_task(lock.write_acquire())
+    await asyncio.sleep(0)
+    reader_task = asyncio.create_task(lock.read_acquire())
+    await asyncio.sleep(0)
+    assert not reader_task.done()
+
+    writer_task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await writer_task
+
+    await asyncio.wait_for(reader_task, timeout=1.0)
+    lock.read_release()
+    lock.read_release()
+    async with lock.writing():
+        pass